@@ -1,6 +1,8 @@
 from __future__ import annotations
+import copy
+import pickle
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 from abc import ABC
 
 class PathElement(ABC):
@@ -69,4 +71,71 @@ class Path:
     def reorder_elements(self, new_order: List[int]):
         if len(new_order) != len(self.path_elements):
             raise ValueError("New order must match elements length")
-        self.path_elements = [self.path_elements[i] for i in new_order]
\ No newline at end of file
+        self.path_elements = [self.path_elements[i] for i in new_order]
+
+    def snapshot(self) -> "Path":
+        """Return an independent copy of this path for undo history.
+
+        Copies each node's attributes directly instead of going through copy.deepcopy,
+        which pays for memo bookkeeping and __reduce_ex__ dispatch on every node.
+        """
+        return Path(
+            [clone_element(e) for e in self.path_elements],
+            _copy_node(self.constraints),
+            [_copy_node(rc) for rc in self.ranged_constraints],
+        )
+
+def _copy_node(node):
+    """Copy a model dataclass whose attributes are plain values.
+
+    vars(node) is copied as a whole, so attributes attached outside the declared fields
+    (the sidebar tags ranged constraints with _ui_instance_id) stay with the copy.
+    """
+    new = object.__new__(type(node))
+    new.__dict__.update(node.__dict__)
+    return new
+
+def _clone_waypoint(w: Waypoint) -> Waypoint:
+    new = _copy_node(w)
+    new.translation_target = _copy_node(w.translation_target)
+    new.rotation_target = _copy_node(w.rotation_target)
+    return new
+
+_CLONERS = {
+    TranslationTarget: _copy_node,
+    RotationTarget: _copy_node,
+    Waypoint: _clone_waypoint,
+}
+
+def clone_element(element: PathElement) -> PathElement:
+    """Return an independent copy of a single path element."""
+    cloner = _CLONERS.get(type(element))
+    if cloner is None:
+        # Unknown element type: a pickle round-trip is cheaper than deepcopy for plain data;
+        # deepcopy remains the last resort for anything that cannot be pickled
+        try:
+            return pickle.loads(pickle.dumps(element, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return copy.deepcopy(element)
+    return cloner(element)
+
+def anchor_neighbor_indices(is_anchor: Sequence[bool]) -> Tuple[List[int], List[int]]:
+    """Return (prev, next) tables of the nearest anchor index before/after each position (-1 if none).
+
+    Anchors are the TranslationTarget and Waypoint elements. Callers pass one flag per position,
+    so the canvas can build the same tables from its graphics items.
+    """
+    n = len(is_anchor)
+    prev = [-1] * n
+    nxt = [-1] * n
+    last = -1
+    for i in range(n):
+        prev[i] = last
+        if is_anchor[i]:
+            last = i
+    last = -1
+    for i in range(n - 1, -1, -1):
+        nxt[i] = last
+        if is_anchor[i]:
+            last = i
+    return prev, nxt
@@ -16,6 +16,10 @@ class TransportControls:
         self.btn: Optional[QPushButton] = None
         self.slider: Optional[QSlider] = None
         self.label: Optional[QLabel] = None
+        # Coalesces repeated reposition requests into one deferred pass per event-loop turn
+        self._position_pending: bool = False
+        # True while the user holds the slider handle; playback must not fight the drag
+        self._slider_user_interacting: bool = False
 
     def ensure(self):
         if self.widget is not None:
@@ -108,6 +112,8 @@ class TransportControls:
             pass
 
         slider.valueChanged.connect(self.canvas_view._on_slider_changed)
+        slider.sliderPressed.connect(self._on_slider_pressed)
+        slider.sliderReleased.connect(self._on_slider_released)
         slider.sliderPressed.connect(self.canvas_view._on_slider_pressed)
         slider.sliderReleased.connect(self.canvas_view._on_slider_released)
 
@@ -127,13 +133,43 @@ class TransportControls:
         proxy.setFlag(QGraphicsItem.ItemIgnoresTransformations, True)
         self.canvas_view.graphics_scene.addItem(proxy)
         self.proxy, self.widget, self.btn, self.slider, self.label = proxy, w, btn, slider, lbl
-        QTimer.singleShot(0, self.position)
+        self.request_position()
+
+    def _on_slider_pressed(self):
+        self._slider_user_interacting = True
+
+    def _on_slider_released(self):
+        self._slider_user_interacting = False
+
+    def set_value_silent(self, value: int):
+        """Move the slider without emitting valueChanged; ignored while the user drags it."""
+        slider = self.slider
+        if slider is None or self._slider_user_interacting:
+            return
+        slider.blockSignals(True)
+        try:
+            slider.setValue(value)
+        finally:
+            slider.blockSignals(False)
+
+    def request_position(self):
+        """Schedule a single deferred reposition; repeated calls before it runs are dropped."""
+        if self._position_pending:
+            return
+        self._position_pending = True
+        QTimer.singleShot(0, self._do_position)
+
+    def _do_position(self):
+        self._position_pending = False
+        self.position()
 
     def position(self):
         if self.proxy is None:
             return
-        view_rect: QRect = self.canvas_view.viewport().rect()
+        view = self.canvas_view
+        widget = self.widget
+        view_rect: QRect = view.viewport().rect()
+        h = widget.height() if widget is not None else 28
         px = view_rect.left() + 12
-        py = view_rect.bottom() - 12 - (self.widget.height() if self.widget else 28)
-        scene_pos = self.canvas_view.mapToScene(px, py)
-        self.proxy.setPos(scene_pos)
+        py = view_rect.bottom() - 12 - h
+        self.proxy.setPos(view.mapToScene(px, py))
@@ -1,5 +1,6 @@
 """Graphics item subclasses for path elements (circle/rect + rotation handle + handoff radius)."""
 from __future__ import annotations
+import functools
 import math
 from typing import Optional, List
 from PySide6.QtWidgets import (
@@ -16,6 +17,16 @@ from ..constants import (
 )
 from models.path_model import Waypoint, TranslationTarget
 
+# Same constant math.degrees multiplies by; one multiply instead of a module attribute call
+_DEG_PER_RAD = 180.0 / math.pi
+
+# Triangle polygons keyed by geometry; QPolygonF is a value type so items can share them. Bounded because
+# live robot-size edits produce a new geometry per spinner step
+@functools.lru_cache(maxsize=16)
+def triangle_polygon(tip_x: float, back_x: float, half_base: float) -> QPolygonF:
+    """Return a (cached) direction triangle pointing along +x."""
+    return QPolygonF([QPointF(tip_x, 0.0), QPointF(back_x, half_base), QPointF(back_x, -half_base)])
+
 class CircleElementItem(QGraphicsEllipseItem):
     def __init__(self, canvas_view: 'CanvasView', center_m: QPointF, index_in_model: int,
                  *, filled_color: Optional[QColor], outline_color: Optional[QColor],
@@ -47,8 +58,7 @@ class CircleElementItem(QGraphicsEllipseItem):
         base_size = ELEMENT_CIRCLE_RADIUS_M * 2 * TRIANGLE_REL_SIZE
         half_base = base_size * 0.5
         height = base_size
-        points = [QPointF(height/2.0, 0.0), QPointF(-height/2.0, half_base), QPointF(-height/2.0, -half_base)]
-        self.triangle_item.setPolygon(QPolygonF(points))
+        self.triangle_item.setPolygon(triangle_polygon(height/2.0, -height/2.0, half_base))
         self.triangle_item.setBrush(QBrush(color))
         self.triangle_item.setPen(OUTLINE_EDGE_PEN)
         self.triangle_item.setZValue(self.zValue() + 1)
@@ -57,8 +67,11 @@ class CircleElementItem(QGraphicsEllipseItem):
         self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
 
     def set_angle_radians(self, radians: float):
+        # setRotation runs prepareGeometryChange (and itemChange) even for an unchanged angle
+        if radians == self._angle_radians:
+            return
         self._angle_radians = radians
-        self.setRotation(math.degrees(-radians))
+        self.setRotation(-radians * _DEG_PER_RAD)
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
         if change == QGraphicsItem.ItemPositionChange:
@@ -150,8 +163,7 @@ class RectElementItem(QGraphicsRectItem):
         base_size = min(rw, rh) * TRIANGLE_REL_SIZE
         half_base = base_size * 0.5
         height = base_size
-        points = [QPointF(height/2.0, 0.0), QPointF(-height/2.0, half_base), QPointF(-height/2.0, -half_base)]
-        self.triangle_item.setPolygon(QPolygonF(points))
+        self.triangle_item.setPolygon(triangle_polygon(height/2.0, -height/2.0, half_base))
         from models.path_model import Waypoint  # local import to avoid cycle
         if isinstance(self.canvas_view._path.path_elements[self.index_in_model], Waypoint):
             self.triangle_item.setBrush(Qt.NoBrush)
@@ -169,8 +181,11 @@ class RectElementItem(QGraphicsRectItem):
         self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
 
     def set_angle_radians(self, radians: float):
+        # setRotation runs prepareGeometryChange (and itemChange) even for an unchanged angle
+        if radians == self._angle_radians:
+            return
         self._angle_radians = radians
-        self.setRotation(math.degrees(-radians))
+        self.setRotation(-radians * _DEG_PER_RAD)
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value):
         if change == QGraphicsItem.ItemPositionChange:
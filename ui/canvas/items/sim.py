@@ -1,22 +1,17 @@
 """Simulation overlay graphics items for the canvas."""
 from __future__ import annotations
-import math
 from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsPolygonItem, QGraphicsItem
 from PySide6.QtCore import QPointF
-from PySide6.QtGui import QBrush, QColor, QPen, QPolygonF
+from PySide6.QtGui import QBrush, QColor, QPen
+
+from .elements import triangle_polygon, _DEG_PER_RAD
 
 class RobotSimItem(QGraphicsRectItem):
     def __init__(self, canvas_view: 'CanvasView'):
         super().__init__()
         self.canvas_view = canvas_view
-        robot_width_m = 0.5; robot_length_m = 0.5
-        try:
-            if hasattr(canvas_view, '_project_manager') and canvas_view._project_manager:
-                cfg = canvas_view._project_manager.config or {}
-                robot_width_m = float(cfg.get('robot_width_meters', robot_width_m))
-                robot_length_m = float(cfg.get('robot_length_meters', robot_length_m))
-        except Exception:
-            pass
+        # The view keeps preparsed robot dimensions in sync with the project config
+        robot_length_m = canvas_view.robot_length_m; robot_width_m = canvas_view.robot_width_m
         self.setRect(-robot_length_m/2, -robot_width_m/2, robot_length_m, robot_width_m)
         self.setBrush(QBrush(QColor(255,165,0,120)))
         self.setPen(QPen(QColor('#000000'), 0.03))
@@ -36,10 +31,9 @@ class RobotSimItem(QGraphicsRectItem):
             return
         triangle_size = min(robot_length_m, robot_width_m) * 0.3
         triangle_offset = robot_length_m * 0.3
-        points = [QPointF(triangle_offset + triangle_size, 0.0),
-                  QPointF(triangle_offset - triangle_size/2, triangle_size/2),
-                  QPointF(triangle_offset - triangle_size/2, -triangle_size/2)]
-        self.triangle_item.setPolygon(QPolygonF(points))
+        self.triangle_item.setPolygon(triangle_polygon(triangle_offset + triangle_size,
+                                                       triangle_offset - triangle_size/2,
+                                                       triangle_size/2))
         self.triangle_item.setBrush(QBrush(QColor('#FFFFFF')))
         self.triangle_item.setPen(QPen(QColor('#000000'), 0.02))
         self.triangle_item.setZValue(self.zValue() + 1)
@@ -48,5 +42,8 @@ class RobotSimItem(QGraphicsRectItem):
         self.setPos(self.canvas_view._scene_from_model(center_m.x(), center_m.y()))
 
     def set_angle_radians(self, radians: float):
+        # setRotation runs prepareGeometryChange (and itemChange) even for an unchanged angle
+        if radians == self._angle_radians:
+            return
         self._angle_radians = radians
-        self.setRotation(math.degrees(-radians))
+        self.setRotation(-radians * _DEG_PER_RAD)
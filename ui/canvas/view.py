@@ -11,7 +11,7 @@ from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPixmapItem
 from PySide6.QtCore import Qt, QPointF, QTimer, Signal, QPoint
 from PySide6.QtGui import QPainter, QPixmap, QTransform, QColor, QPen, QBrush, QPixmapCache
 
-from models.path_model import Path, PathElement, TranslationTarget, RotationTarget, Waypoint
+from models.path_model import Path, PathElement, TranslationTarget, RotationTarget, Waypoint, anchor_neighbor_indices
 from models.simulation import simulate_path, SimResult
 from .constants import (
     FIELD_LENGTH_METERS, FIELD_WIDTH_METERS, CONNECT_LINE_THICKNESS_M,
@@ -34,6 +34,10 @@ def _get_translation_position(element: Any) -> Tuple[float, float]:
         return 0.0, 0.0
 
 
+# Item kind built by _rebuild_items for each element type
+_ITEM_KIND = {TranslationTarget: 'translation', RotationTarget: 'rotation', Waypoint: 'waypoint'}
+
+
 class CanvasView(QGraphicsView):
     # Signals (mirroring original)
     elementSelected = Signal(int)
@@ -42,6 +46,7 @@ class CanvasView(QGraphicsView):
     elementDragFinished = Signal(int)
     deleteSelectedRequested = Signal()
     rotationDragFinished = Signal(int)
+    viewPressed = Signal()  # any mouse press on the canvas viewport
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -84,7 +89,14 @@ class CanvasView(QGraphicsView):
         self._path: Optional[Path] = None
         self._items: List[Tuple[str, RectElementItem, Optional[RotationHandle]]] = []
         self._connect_lines: List[QGraphicsLineItem] = []
+        # Indices of 'rotation' items; lets anchor drags skip the full item scan
+        self._rotation_item_indices: List[int] = []
+        # Per item index: nearest 'translation'/'waypoint' item before/after it (-1 if none)
+        self._anchor_item_prev: List[int] = []
+        self._anchor_item_next: List[int] = []
         self._handoff_visualizers: List[Optional[HandoffRadiusVisualizer]] = []
+        # id() of the model element behind each item, so a reorder of the same elements can reuse items
+        self._item_element_ids: List[int] = []
         self._load_field_background(":/assets/field25.png")
         # Simulation state
         self._sim_result: Optional[SimResult] = None
@@ -101,6 +113,11 @@ class CanvasView(QGraphicsView):
         self.transport = TransportControls(self); self.transport.ensure()
         self._range_overlay_lines: List[QGraphicsLineItem] = []
         self._range_overlay_saved_item_styles: dict[QGraphicsItem, Tuple[QPen, QBrush]] = {}
+        # Batch updates (see begin_batch_update): item rebuilds, selection and sim requests are deferred
+        self._batch_depth = 0
+        self._batch_items_dirty = False
+        self._batch_sim_requested = False
+        self._batch_select_index: Optional[int] = None
 
     # ---------------- Field Background ----------------
     def _load_field_background(self, image_path: str):
@@ -137,11 +154,43 @@ class CanvasView(QGraphicsView):
     def set_project_manager(self, project_manager):
         self._project_manager = project_manager
 
+    # ------------- Batch updates -------------
+    def begin_batch_update(self):
+        """Defer item rebuilds, repaints and simulation requests until the matching end_batch_update()."""
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self._batch_items_dirty = False; self._batch_sim_requested = False; self._batch_select_index = None
+            try: self.setUpdatesEnabled(False)
+            except Exception: pass
+
+    def end_batch_update(self):
+        if self._batch_depth <= 0: return
+        self._batch_depth -= 1
+        if self._batch_depth: return
+        try:
+            if self._batch_items_dirty:
+                self._batch_items_dirty = False
+                self._rebuild_items()
+                if self._path: self._reproject_rotation_items_in_scene()
+            if self._batch_select_index is not None:
+                index = self._batch_select_index; self._batch_select_index = None
+                self.select_index(index)
+        finally:
+            try: self.setUpdatesEnabled(True)
+            except Exception: pass
+        if self._batch_sim_requested:
+            self._batch_sim_requested = False
+            self.request_simulation_rebuild()
+
     # ------------- Path / Items -------------
     def set_path(self, path: Path):
+        same_path = path is self._path
         self._path = path
         try: self.clear_constraint_range_overlay()
         except Exception: pass
+        if self._batch_depth:
+            self._batch_items_dirty = True; self.request_simulation_rebuild(); return
+        if same_path and self._reorder_items(): return
         self._rebuild_items()
         if self._path: self._reproject_rotation_items_in_scene()
         self.request_simulation_rebuild()
@@ -149,8 +198,10 @@ class CanvasView(QGraphicsView):
     def set_robot_dimensions(self, length_m: float, width_m: float):
         try: self.robot_length_m = float(length_m); self.robot_width_m = float(width_m)
         except Exception: return
-        self._rebuild_items()
-        if self._path: self._reproject_rotation_items_in_scene()
+        if self._batch_depth: self._batch_items_dirty = True
+        else:
+            self._rebuild_items()
+            if self._path: self._reproject_rotation_items_in_scene()
         try:
             self._ensure_sim_robot_item()
             if self._sim_robot_item: self._sim_robot_item.set_dimensions(self.robot_length_m, self.robot_width_m)
@@ -158,6 +209,7 @@ class CanvasView(QGraphicsView):
 
     # ----------- Handoff Radius -----------
     def update_handoff_radius_visualizers(self):
+        if self._batch_items_dirty: self.request_simulation_rebuild(); return
         if self._path is None or not self._items: return
         from models.path_model import TranslationTarget, Waypoint
         for i,(kind,item,_handle) in enumerate(self._items):
@@ -195,6 +247,7 @@ class CanvasView(QGraphicsView):
         self.request_simulation_rebuild()
 
     def refresh_from_model(self):
+        if self._batch_items_dirty: self.request_simulation_rebuild(); return
         if self._path is None or not self._items: return
         self._suppress_live_events = True
         try:
@@ -218,6 +271,7 @@ class CanvasView(QGraphicsView):
         self.request_simulation_rebuild()
 
     def refresh_rotations_from_model(self):
+        if self._batch_items_dirty: self.request_simulation_rebuild(); return
         if self._path is None or not self._items: return
         max_index = len(self._path.path_elements)-1
         for i,(kind,item,handle) in enumerate(self._items):
@@ -233,6 +287,7 @@ class CanvasView(QGraphicsView):
         self._update_connecting_lines(); self.request_simulation_rebuild()
 
     def select_index(self, index:int):
+        if self._batch_items_dirty: self._batch_select_index = index; return
         if index is None or index<0 or index>=len(self._items): return
         try: _,item,_ = self._items[index]
         except Exception: return
@@ -251,10 +306,10 @@ class CanvasView(QGraphicsView):
 
     # ------------- Resize / Show -------------
     def resizeEvent(self, event):
-        super().resizeEvent(event); QTimer.singleShot(0, self._fit_to_scene); QTimer.singleShot(0, self.transport.position)
+        super().resizeEvent(event); QTimer.singleShot(0, self._fit_to_scene); self.transport.request_position()
 
     def showEvent(self, event):
-        super().showEvent(event); QTimer.singleShot(0, self._fit_to_scene); QTimer.singleShot(0, self.transport.position)
+        super().showEvent(event); QTimer.singleShot(0, self._fit_to_scene); self.transport.request_position()
 
     def _fit_to_scene(self):
         if self._is_fitting: return
@@ -266,7 +321,7 @@ class CanvasView(QGraphicsView):
                     self.fitInView(rect, Qt.KeepAspectRatio)
                     if abs(self._zoom_factor-1.0)>1e-6: self.scale(self._zoom_factor, self._zoom_factor)
                     # After any fit/scale, reposition transport overlay to viewport corner
-                    QTimer.singleShot(0, self.transport.position)
+                    self.transport.request_position()
                 except Exception: pass
         finally:
             self._is_fitting=False
@@ -279,7 +334,8 @@ class CanvasView(QGraphicsView):
         for line in self._connect_lines: self.graphics_scene.removeItem(line)
         for viz in self._handoff_visualizers:
             if viz: self.graphics_scene.removeItem(viz)
-        self._items.clear(); self._connect_lines.clear(); self._handoff_visualizers.clear()
+        self._items.clear(); self._connect_lines.clear(); self._handoff_visualizers.clear(); self._rotation_item_indices.clear()
+        self._anchor_item_prev=[]; self._anchor_item_next=[]; self._item_element_ids=[]
 
     def _rebuild_items(self):
         self._clear_scene_items()
@@ -323,10 +379,42 @@ class CanvasView(QGraphicsView):
                 for sub in rotation_handle.scene_items():
                     try: self.graphics_scene.addItem(sub)
                     except Exception: continue
+            if kind=="rotation": self._rotation_item_indices.append(len(self._items))
             self._items.append((kind,item,rotation_handle))
             self._handoff_visualizers.append(handoff_visualizer)
+        elements=self._path.path_elements
+        if len(self._items)==len(elements): self._item_element_ids=[id(e) for e in elements]
+        self._build_anchor_item_tables()
         self._build_connecting_lines()
 
+    def _reorder_items(self) -> bool:
+        # Same elements, possibly in a new order (list drag-and-drop, rotation target swap): reuse the
+        # existing items instead of rebuilding the scene. False means a full rebuild is needed.
+        elements=self._path.path_elements; n=len(elements)
+        if not n or n!=len(self._item_element_ids) or n!=len(self._items): return False
+        slot={eid:i for i,eid in enumerate(self._item_element_ids)}
+        order=[slot.get(id(e),-1) for e in elements]
+        if -1 in order or len(set(order))!=n: return False
+        # Nothing moved (a drop onto the same row, a rotation check with nothing to swap)
+        if order==list(range(n)): self.refresh_from_model(); return True
+        # The last element never gets a handoff visualizer, so it has to stay last
+        if order[-1]!=n-1: return False
+        items=[self._items[i] for i in order]
+        for i,(kind,_,_) in enumerate(items):
+            if _ITEM_KIND.get(type(elements[i]))!=kind: return False
+        self._items=items; self._handoff_visualizers=[self._handoff_visualizers[i] for i in order]
+        for i,(_,item,_) in enumerate(items): item.index_in_model=i
+        self._rotation_item_indices=[i for i,(kind,_,_) in enumerate(items) if kind=='rotation']
+        self._item_element_ids=[id(e) for e in elements]
+        self._build_anchor_item_tables()
+        # Positions, angles, lines and rotation projections follow the new neighbors
+        self.refresh_from_model()
+        return True
+
+    def _build_anchor_item_tables(self):
+        # Item kinds only change on rebuild, so neighbor anchors are resolved once here
+        self._anchor_item_prev,self._anchor_item_next=anchor_neighbor_indices([kind in ('translation','waypoint') for kind,_,_ in self._items])
+
     # ------------- Geometry helpers -------------
     def _angle_for_translation_index(self, index:int)->float:
         if self._path is None or index<=0: return 0.0
@@ -379,10 +467,12 @@ class CanvasView(QGraphicsView):
                     self.graphics_scene.addItem(line); self._connect_lines.append(line)
             except Exception: continue
 
-    def _update_connecting_lines(self):
+    def _update_connecting_lines(self, start:int=0, stop:Optional[int]=None):
+        # Line i joins items i and i+1; [start, stop) limits the refresh to lines that moved
         if not self._items or not self._connect_lines: return
-        for i in range(len(self._connect_lines)):
-            if i >= len(self._items)-1: break
+        end=min(len(self._connect_lines), len(self._items)-1)
+        if stop is not None: end=min(end, stop)
+        for i in range(max(start,0), end):
             try:
                 _,a,_=self._items[i]; _,b,_=self._items[i+1]
                 if a and b: self._connect_lines[i].setLine(a.pos().x(),a.pos().y(),b.pos().x(),b.pos().y())
@@ -391,7 +481,8 @@ class CanvasView(QGraphicsView):
     # -------- Live interactions --------
     def _on_item_live_moved(self, index:int, x_m:float, y_m:float):
         if index<0 or index>=len(self._items): return
-        self._update_connecting_lines()
+        # Only the two lines touching the moved item change (anchor moves add their rotation items below)
+        self._update_connecting_lines(index-1, index+1)
         try:
             kind,_,handle=self._items[index]
             if handle: handle.sync_to_angle()
@@ -400,7 +491,7 @@ class CanvasView(QGraphicsView):
             try: self._handoff_visualizers[index].set_center(QPointF(x_m, y_m))
             except Exception: pass
         self.elementMoved.emit(index, x_m, y_m)
-        if kind in ('translation','waypoint'): self._reproject_rotation_items_in_scene()
+        if kind in ('translation','waypoint'): self._reproject_rotation_items_in_scene(index)
         self.request_simulation_rebuild()
 
     def _on_item_live_rotated(self, index:int, angle_radians: float):
@@ -412,10 +503,17 @@ class CanvasView(QGraphicsView):
                 if handle: handle.set_angle(angle_radians)
         except Exception: return
         self.elementRotated.emit(index, angle_radians)
+        # One forward pass on the item kinds: each translation faces the latest rotation-bearing
+        # element before it (what _angle_for_translation_index finds by scanning back per item)
+        elements=self._path.path_elements if self._path is not None else ()
+        last_angle=0.0
         for j,(k,it,_) in enumerate(self._items):
             if k=='translation':
-                try: it.set_angle_radians(self._angle_for_translation_index(j))
+                try: it.set_angle_radians(last_angle)
                 except Exception: continue
+            elif j<len(elements):
+                try: last_angle=self._element_rotation(elements[j])
+                except Exception: pass
         self.request_simulation_rebuild()
 
     def _on_item_clicked(self, index:int): self.elementSelected.emit(index)
@@ -440,25 +538,29 @@ class CanvasView(QGraphicsView):
         proj_x=ax+t*dx; proj_y=ay+t*dy; return self._clamp_scene_coords(proj_x, proj_y)
 
     def _find_neighbor_item_positions(self,index:int)->Tuple[Optional[Tuple[float,float]], Optional[Tuple[float,float]]]:
-        prev_pos=None
-        for i in range(index-1,-1,-1):
-            try:
-                kind,item,_=self._items[i]
-                if kind in ('translation','waypoint'): prev_pos=(item.pos().x(), item.pos().y()); break
-            except Exception: continue
-        next_pos=None
-        for i in range(index+1,len(self._items)):
-            try:
-                kind,item,_=self._items[i]
-                if kind in ('translation','waypoint'): next_pos=(item.pos().x(), item.pos().y()); break
-            except Exception: continue
+        if index<0 or index>=len(self._anchor_item_prev): return None,None
+        pi=self._anchor_item_prev[index]; ni=self._anchor_item_next[index]
+        prev_pos=None; next_pos=None
+        if pi>=0:
+            p=self._items[pi][1].pos(); prev_pos=(p.x(), p.y())
+        if ni>=0:
+            p=self._items[ni][1].pos(); next_pos=(p.x(), p.y())
         return prev_pos,next_pos
 
-    def _reproject_rotation_items_in_scene(self):
+    def _reproject_rotation_items_in_scene(self, anchor_index:int=-1):
+        if not self._rotation_item_indices: return
+        indices=self._rotation_item_indices; line_start=0; line_stop=None
+        if 0<=anchor_index<len(self._anchor_item_prev):
+            # Only the rotation items between the moved anchor and its neighbor anchors depend on it;
+            # items before the first anchor or after the last have no segment and are skipped anyway
+            pa=self._anchor_item_prev[anchor_index]; na=self._anchor_item_next[anchor_index]
+            lo=pa+1 if pa>=0 else anchor_index; hi=na if na>=0 else anchor_index+1
+            indices=[i for i in range(lo,hi) if i!=anchor_index]
+            line_start=lo-1; line_stop=hi
         self._suppress_live_events=True
         try:
-            for i,(kind,item,handle) in enumerate(self._items):
-                if kind!='rotation': continue
+            for i in indices:
+                _,item,handle=self._items[i]
                 prev_pos,next_pos=self._find_neighbor_item_positions(i)
                 if prev_pos is None or next_pos is None: continue
                 ax,ay=prev_pos; bx,by=next_pos
@@ -473,13 +575,13 @@ class CanvasView(QGraphicsView):
                 try: item.setPos(proj_x, proj_y);
                 except Exception: continue
                 if handle: handle.sync_to_angle()
-            self._update_connecting_lines()
+            self._update_connecting_lines(line_start, line_stop)
         finally: self._suppress_live_events=False
 
     def _compute_rotation_t_cache(self)->dict[int,float]:
         t_by_index={}
-        for i,(kind,item,_) in enumerate(self._items):
-            if kind!='rotation': continue
+        for i in self._rotation_item_indices:
+            _,item,_=self._items[i]
             prev_pos,next_pos=self._find_neighbor_item_positions(i)
             if prev_pos is None or next_pos is None: continue
             ax,ay=prev_pos; bx,by=next_pos; dx=bx-ax; dy=by-ay; denom=dx*dx+dy*dy
@@ -497,8 +599,8 @@ class CanvasView(QGraphicsView):
     def _on_item_released(self,index:int):
         if self._anchor_drag_in_progress:
             try:
-                for i,(kind,item,_) in enumerate(self._items):
-                    if kind!='rotation': continue
+                for i in self._rotation_item_indices:
+                    _,item,_=self._items[i]
                     mx,my=self._model_from_scene(item.pos().x(), item.pos().y())
                     self.elementMoved.emit(i, mx, my)
             finally:
@@ -507,6 +609,7 @@ class CanvasView(QGraphicsView):
 
     # -------- Simulation API (subset) --------
     def request_simulation_rebuild(self):
+        if self._batch_depth: self._batch_sim_requested = True; return
         try: self._sim_debounce.start()
         except Exception: pass
 
@@ -514,8 +617,6 @@ class CanvasView(QGraphicsView):
         try:
             if self._sim_robot_item: return
             item=RobotSimItem(self); self.graphics_scene.addItem(item); self._sim_robot_item=item; item.setVisible(False)
-            try: item.set_dimensions(self.robot_length_m, self.robot_width_m)
-            except Exception: pass
         except Exception: pass
 
     def _update_sim_robot_visibility(self):
@@ -564,8 +665,7 @@ class CanvasView(QGraphicsView):
                 if not self._sim_times_sorted: return
                 if self._sim_current_time_s >= self._sim_total_time_s:
                     self._sim_current_time_s=0.0; self._seek_to_time(0.0)
-                    if self.transport.slider:
-                        self.transport.slider.blockSignals(True); self.transport.slider.setValue(0); self.transport.slider.blockSignals(False)
+                    self.transport.set_value_silent(0)
                     self._update_trail_visibility(0)
                 self._sim_timer.start();
                 if self.transport.btn: self.transport.btn.setText('⏸')
@@ -609,8 +709,7 @@ class CanvasView(QGraphicsView):
             if self._sim_current_time_s >= self._sim_total_time_s:
                 self._sim_current_time_s = self._sim_total_time_s; self._sim_timer.stop();
                 if self.transport.btn: self.transport.btn.setText('▶')
-            if self.transport.slider:
-                self.transport.slider.blockSignals(True); self.transport.slider.setValue(int(round(self._sim_current_time_s*1000.0))); self.transport.slider.blockSignals(False)
+            self.transport.set_value_silent(int(round(self._sim_current_time_s*1000.0)))
             self._seek_to_time(self._sim_current_time_s)
         except Exception: pass
 
@@ -676,7 +775,7 @@ class CanvasView(QGraphicsView):
             else: self._zoom_factor=new_zoom
             self.scale(factor,factor); event.accept()
             # Keep transport overlay anchored after zooming
-            try: self.transport.position()
+            try: self.transport.request_position()
             except Exception: pass
         except Exception:
             try: super().wheelEvent(event)
@@ -708,6 +807,7 @@ class CanvasView(QGraphicsView):
             return False
 
     def mousePressEvent(self,event):
+        self.viewPressed.emit()
         try:
             # Use left-click to pan on empty/background (not on interactive items)
             if event.button()==Qt.LeftButton and self._should_start_pan(event.pos()):
@@ -724,7 +824,7 @@ class CanvasView(QGraphicsView):
         super().mouseMoveEvent(event)
 
         # Reposition overlay when the view scrolls due to any movement
-        try: self.transport.position()
+        try: self.transport.request_position()
         except Exception: pass
 
     def scrollContentsBy(self, dx: int, dy: int):
@@ -732,7 +832,7 @@ class CanvasView(QGraphicsView):
         try:
             super().scrollContentsBy(dx, dy)
         finally:
-            try: self.transport.position()
+            try: self.transport.request_position()
             except Exception: pass
 
     def mouseReleaseEvent(self,event):
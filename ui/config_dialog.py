@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import math
+
+from functools import partial
 from typing import Callable, Dict, Optional
 
 from PySide6.QtWidgets import (
@@ -13,7 +16,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QSignalBlocker
 from ui.sidebar.widgets.no_wheel_spinbox import NoWheelDoubleSpinBox
 
 
@@ -23,13 +26,67 @@ class ConfigDialog(QDialog):
     Shows robot dimensions and optional default values.
     """
 
-    def __init__(self, parent=None, existing_config: Optional[Dict[str, float]] = None, on_change: Optional[Callable[[str, float], None]] = None):
+    # (key, label, default, (min, max), step) for each editable config value
+    _SPEC = (
+        # Robot dimensions
+        ("robot_length_meters", "Robot Length (m)", 0.60, (0.05, 5.0), 0.01),
+        ("robot_width_meters", "Robot Width (m)", 0.60, (0.05, 5.0), 0.01),
+        # Optional defaults
+        ("default_max_velocity_meters_per_sec", "Default Max Velocity (m/s)", 0.0, (0.0, 99999.0), 0.1),
+        ("default_max_acceleration_meters_per_sec2", "Default Max Accel (m/s²)", 0.0, (0.0, 99999.0), 0.1),
+        ("default_intermediate_handoff_radius_meters", "Default Handoff Radius (m)", 0.0, (0.0, 99999.0), 0.05),
+        ("default_max_velocity_deg_per_sec", "Default Max Rot Vel (deg/s)", 0.0, (0.0, 99999.0), 1.0),
+        ("default_max_acceleration_deg_per_sec2", "Default Max Rot Accel (deg/s²)", 0.0, (0.0, 99999.0), 1.0),
+        ("default_end_translation_tolerance_meters", "End Translation Tolerance (m)", 0.05, (0.0, 1.0), 0.01),
+        ("default_end_rotation_tolerance_deg", "End Rotation Tolerance (deg)", 2.0, (0.0, 180.0), 0.1),
+        # Editor behaviour
+        ("autosave_debounce_ms", "Autosave Delay (ms)", 1000.0, (0.0, 10000.0), 100.0),
+    )
+
+    @staticmethod
+    def _initial(cfg: Dict[str, float], key: str, default: float, rng) -> float:
+        value = cfg.get(key)
+        if value is None:
+            return default
+        value = float(value)
+        # A stored 0 the row cannot hold (e.g. robot size) means "unset"; an in-range 0 is a real setting
+        if value == 0.0 and rng[0] > 0.0:
+            return default
+        return value
+
+    def __init__(self, parent=None, existing_config: Optional[Dict[str, float]] = None, on_change: Optional[Callable[[str, float], None]] = None,
+                 on_change_many: Optional[Callable[[Dict[str, float]], None]] = None):
         super().__init__(parent)
         self.setWindowTitle("Edit Config")
         self.setModal(True)
         self._spins: Dict[str, NoWheelDoubleSpinBox] = {}
         cfg = existing_config or {}
         self._on_change = on_change
+        # Batched variant: receives every field changed in one debounce burst at once
+        self._on_change_many = on_change_many
+        # Coalesce bursts of spinner edits (held arrows, typing) into one callback per field
+        self._pending: Dict[str, float] = {}
+        # Last value delivered per key; QDoubleSpinBox can re-emit an unchanged value
+        self._last_values: Dict[str, float] = {}
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(400)
+        self._save_timer.timeout.connect(self.flush_pending)
+        # Widgets are built on first show (or first value access), not at construction
+        self._initial_cfg: Dict[str, float] = cfg
+        self._built = False
+
+    def setVisible(self, visible: bool):
+        # Build before Qt sizes the dialog for its first show
+        if visible:
+            self._ensure_built()
+        super().setVisible(visible)
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
+        cfg = self._initial_cfg
 
         # Apply dark dialog background to match the app
         try:
@@ -129,9 +186,11 @@ class ConfigDialog(QDialog):
 
             spin = NoWheelDoubleSpinBox(self)
             spin.setDecimals(4)
+            # Emit on Enter/focus-out/arrow steps only, not per typed digit
+            spin.setKeyboardTracking(False)
             spin.setSingleStep(step)
             spin.setRange(rng[0], rng[1])
-            spin.setValue(float(cfg.get(key, default)))
+            spin.setValue(self._initial(cfg, key, default, rng))
             try:
                 spin.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
                 spin.setMinimumWidth(120)
@@ -144,21 +203,12 @@ class ConfigDialog(QDialog):
             group_layout.addWidget(row)
 
             self._spins[key] = spin
-            # Live autosave via callback
-            spin.valueChanged.connect(lambda _v, k=key, w=spin: self._emit_change(k, float(w.value())))
-
-        # Robot dimensions
-        add_spin("robot_length_meters", "Robot Length (m)", cfg.get("robot_length_meters", 0.60) or 0.60, (0.05, 5.0), 0.01)
-        add_spin("robot_width_meters", "Robot Width (m)", cfg.get("robot_width_meters", 0.60) or 0.60, (0.05, 5.0), 0.01)
+            self._last_values[key] = float(spin.value())
+            # Live autosave via callback (debounced)
+            spin.valueChanged.connect(partial(self._queue_change, key))
 
-        # Optional defaults
-        add_spin("default_max_velocity_meters_per_sec", "Default Max Velocity (m/s)", float(cfg.get("default_max_velocity_meters_per_sec", 0.0) or 0.0), (0.0, 99999.0), 0.1)
-        add_spin("default_max_acceleration_meters_per_sec2", "Default Max Accel (m/s²)", float(cfg.get("default_max_acceleration_meters_per_sec2", 0.0) or 0.0), (0.0, 99999.0), 0.1)
-        add_spin("default_intermediate_handoff_radius_meters", "Default Handoff Radius (m)", float(cfg.get("default_intermediate_handoff_radius_meters", 0.0) or 0.0), (0.0, 99999.0), 0.05)
-        add_spin("default_max_velocity_deg_per_sec", "Default Max Rot Vel (deg/s)", float(cfg.get("default_max_velocity_deg_per_sec", 0.0) or 0.0), (0.0, 99999.0), 1.0)
-        add_spin("default_max_acceleration_deg_per_sec2", "Default Max Rot Accel (deg/s²)", float(cfg.get("default_max_acceleration_deg_per_sec2", 0.0) or 0.0), (0.0, 99999.0), 1.0)
-        add_spin("default_end_translation_tolerance_meters", "End Translation Tolerance (m)", float(cfg.get("default_end_translation_tolerance_meters", 0.05) or 0.05), (0.0, 1.0), 0.01)
-        add_spin("default_end_rotation_tolerance_deg", "End Rotation Tolerance (deg)", float(cfg.get("default_end_rotation_tolerance_deg", 2.0) or 2.0), (0.0, 180.0), 0.1)
+        for key, label, default, rng, step in self._SPEC:
+            add_spin(key, label, default, rng, step)
 
         # Buttons styled to fit dark UI
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, orientation=Qt.Horizontal, parent=self)
@@ -183,12 +233,52 @@ class ConfigDialog(QDialog):
         root.addWidget(buttons)
 
     def get_values(self) -> Dict[str, float]:
+        self._ensure_built()
         result: Dict[str, float] = {}
         for k, spin in self._spins.items():
             result[k] = float(spin.value())
         return result
 
+    def accept(self):
+        self.flush_pending()
+        super().accept()
+
+    def reject(self):
+        # Cancel discards the whole session anyway; drop edits that never reached the callback
+        self._save_timer.stop()
+        self._pending.clear()
+        super().reject()
+
+    def _queue_change(self, key: str, value: float):
+        self._pending[key] = float(value)
+        self._save_timer.start()
+
+    def flush_pending(self) -> None:
+        """Deliver any debounced spinner edits to the change callback immediately."""
+        self._save_timer.stop()
+        pending, self._pending = self._pending, {}
+        if self._on_change_many is None:
+            for key, value in pending.items():
+                self._emit_change(key, value)
+            return
+        changed = {k: v for k, v in pending.items() if self._take_if_changed(k, v)}
+        if changed:
+            try:
+                self._on_change_many(changed)
+            except Exception:
+                pass
+
+    def _take_if_changed(self, key: str, value: float) -> bool:
+        """Record value as last delivered for key; False if it matches the previous one."""
+        last = self._last_values.get(key)
+        if last is not None and math.isclose(last, value, rel_tol=0.0, abs_tol=1e-9):
+            return False
+        self._last_values[key] = float(value)
+        return True
+
     def _emit_change(self, key: str, value: float):
+        if not self._take_if_changed(key, value):
+            return
         if self._on_change is not None:
             try:
                 self._on_change(key, float(value))
@@ -197,14 +287,23 @@ class ConfigDialog(QDialog):
 
     def sync_from_config(self, cfg: Dict[str, float]) -> None:
         """Update spinner values from the provided config without emitting signals."""
-        for key, spin in self._spins.items():
+        self._ensure_built()
+        # Walk whichever side is smaller; live syncs often carry a single changed key
+        spins = self._spins
+        if len(cfg) < len(spins):
+            items = ((key, spins.get(key), value) for key, value in cfg.items())
+        else:
+            items = ((key, spin, cfg.get(key)) for key, spin in spins.items())
+        for key, spin, value in items:
+            if spin is None or value is None:
+                continue
+            # A bad value in a hand-edited config.json must not stop the remaining spinners syncing
             try:
-                spin.blockSignals(True)
-                if key in cfg and cfg[key] is not None:
-                    spin.setValue(float(cfg[key]))
+                blocker = QSignalBlocker(spin)
+                spin.setValue(float(value))
+                blocker.unblock()
+                self._last_values[key] = float(spin.value())
             except Exception:
                 pass
-            finally:
-                spin.blockSignals(False)
 
 
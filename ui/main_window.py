@@ -1,23 +1,192 @@
-from PySide6.QtWidgets import QMainWindow, QHBoxLayout, QWidget, QFileDialog, QMenuBar, QMenu, QDialog, QToolBar, QToolButton, QApplication, QFrame, QSizePolicy, QLabel
+from PySide6.QtWidgets import (
+    QMainWindow, QHBoxLayout, QVBoxLayout, QWidget, QFileDialog, QMenuBar, QMenu, QDialog, QToolBar,
+    QToolButton, QFrame, QSizePolicy, QLabel, QMessageBox, QInputDialog, QPushButton, QListWidget,
+    QListWidgetItem, QAbstractItemView
+)
 from PySide6.QtGui import QAction, QKeySequence, QIcon, QPixmap, QPainter, QPolygon, QPen, QBrush, QColor
-from PySide6.QtCore import QPoint, QSize
+from PySide6.QtCore import Qt, QTimer, QEvent, QPoint, QSize, Slot, QThreadPool
+import functools
 import math
 import os
-import copy
 
 from .sidebar import Sidebar
-from .sidebar.utils import clamp_from_metadata
-from models.path_model import TranslationTarget, RotationTarget, Waypoint, Path
+from .sidebar.utils import SPINNER_METADATA
+from models.path_model import TranslationTarget, RotationTarget, Waypoint, Path, clone_element, anchor_neighbor_indices
 from .canvas import CanvasView, FIELD_LENGTH_METERS, FIELD_WIDTH_METERS
-from typing import Tuple
-from PySide6.QtCore import Qt, QTimer, QEvent
-from utils.project_manager import ProjectManager
-from utils.undo_system import UndoRedoManager, PathCommand, ConfigCommand
-from .config_dialog import ConfigDialog
+from typing import Optional, Tuple
+from utils.project_manager import ProjectManager, PathSaveJob, PathWriteTask
+from utils.undo_system import UndoRedoManager, PathCommand, ConfigCommand, single_element_patch
+
+# Field clamp bounds resolved once from sidebar metadata (used on every drag sample)
+_X_MIN, _X_MAX = SPINNER_METADATA['x_meters']['range']
+_Y_MIN, _Y_MAX = SPINNER_METADATA['y_meters']['range']
+
+# Window chrome styles, applied once on the main window (cascading to its menus and divider)
+# rather than per widget
+APP_STYLESHEET = """
+QFrame#sidebarDivider {
+    background-color: #3b3b3b;
+}
+
+QMenuBar {
+    background-color: #2f2f2f;
+    border: none;
+    border-bottom: 1px solid #4a4a4a;
+    padding: 1px 6px;
+    color: #eeeeee;
+    font-size: 13px;
+}
+QMenuBar::item {
+    background: transparent;
+    padding: 3px 6px;
+    margin: 0px 2px;
+    border-radius: 4px;
+    border-left: 1px solid #3b3b3b; /* slim vertical separator */
+}
+QMenuBar::item:selected {
+    background: #555555;
+}
+QMenuBar::item:pressed {
+    background: #666666;
+}
+
+QMenuBar QMenu {
+    background-color: #242424;
+    border: 1px solid #3f3f3f;
+    color: #f0f0f0;
+    padding: 3px 0;
+}
+QMenuBar QMenu::item {
+    padding: 3px 10px;
+    margin: 1px 3px;
+    border-radius: 3px;
+}
+QMenuBar QMenu::item:selected {
+    background: #555555;
+}
+QMenuBar QMenu::separator {
+    height: 1px;
+    margin: 2px 6px; /* slim horizontal spacers */
+    background: #3b3b3b;
+}
+QMenuBar QMenu::indicator {
+    width: 6px;
+    height: 6px;
+    margin-right: 10px;
+    margin-left: 4px;
+}
+QMenuBar QMenu::item {
+    padding-right: 15px;
+}
+QMenuBar QMenu::item:selected {
+    background: #555555;
+}
+"""
+
+
+@functools.lru_cache(maxsize=4)
+def _arrow_icon(direction: str, size: int, dpr: float) -> QIcon:
+    """Create a small arrow icon for undo/redo buttons, rendered at the screen's pixel ratio."""
+    try:
+        pixmap = QPixmap(max(1, round(size * dpr)), max(1, round(size * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Set up pen and brush - smaller line width for delicate arrows
+        painter.setPen(QPen(QColor("#333333"), 1))
+        painter.setBrush(QBrush(QColor("#333333")))
+
+        # Create simple arrow shape based on direction ("undo" points left, "redo" right)
+        center_x, center_y = size // 2, size // 2
+        arrow_size = size // 4  # Much smaller arrows
+        half, quarter = arrow_size // 2, arrow_size // 4
+        sign = 1 if direction == "undo" else -1
+        arrow = QPolygon([
+            QPoint(center_x - sign * arrow_size, center_y),
+            QPoint(center_x + sign * half, center_y - half),
+            QPoint(center_x + sign * half, center_y - quarter),
+            QPoint(center_x, center_y),
+            QPoint(center_x + sign * half, center_y + quarter),
+            QPoint(center_x + sign * half, center_y + half),
+        ])
+        painter.drawPolygon(arrow)
+        painter.end()
+        return QIcon(pixmap)
+    except Exception:
+        # Return empty icon on error
+        return QIcon()
+
+# Undo descriptions for rotation gestures, keyed on the exact element type
+_ROTATE_LABELS = {
+    RotationTarget: "Rotate RotationTarget",
+    Waypoint: "Rotate Waypoint",
+}
+
+# Human-readable labels for config keys (undo descriptions); shared instead of rebuilt per change
+_CONFIG_KEY_LABELS = {
+    'robot_length_meters': 'Robot Length',
+    'robot_width_meters': 'Robot Width',
+    'max_velocity_meters_per_sec': 'Default Max Velocity',
+    'max_acceleration_meters_per_sec2': 'Default Max Accel',
+    'intermediate_handoff_radius_meters': 'Default Handoff Radius',
+    'max_velocity_deg_per_sec': 'Default Max Rot Vel',
+    'max_acceleration_deg_per_sec2': 'Default Max Rot Accel',
+    'autosave_debounce_ms': 'Autosave Delay',
+}
+
+
+def _path_display_name(filename: str) -> str:
+    """Path filename without its .json extension, as shown in the menu, title and dialogs."""
+    return filename[:-5] if filename.endswith('.json') else filename
+
 
 class MainWindow(QMainWindow):
+    AUTOSAVE_DEBOUNCE_MS_DEFAULT = 1000
+
+    # Menu bar layout: (menu title, entries). An entry is None for a separator, or
+    # (kind, attribute name, label, slot name); "action" entries with no slot are read-only.
+    _MENU_SPEC = (
+        ("Project", (
+            ("action", "action_open_project", "Open Project…", "_action_open_project"),
+            None,
+            ("submenu", "menu_recent_projects", "Recent Projects", "_populate_recent_projects"),
+        )),
+        ("Path", (
+            ("action", "action_current_path", "Current: (No Path)", None),
+            None,
+            ("submenu", "menu_load_path", "Load Path", "_populate_load_path_menu"),
+            None,
+            ("action", "action_new_path", "Create New Path", "_action_create_new_path"),
+            None,
+            ("action", "action_save_as", "Save Path As…", "_action_save_as"),
+            None,
+            ("action", "action_rename_path", "Rename Path…", "_action_rename_path"),
+            None,
+            ("action", "action_delete_path", "Delete Paths…", "_show_delete_path_dialog"),
+        )),
+        # Edit sits after Path, before Settings
+        ("Edit", (
+            ("action", "action_undo", "Undo", "_action_undo"),
+            None,
+            ("action", "action_redo", "Redo", "_action_redo"),
+        )),
+        ("Settings", (
+            ("action", "action_edit_config", "Edit Config…", "_action_edit_config"),
+        )),
+    )
+
     def __init__(self):
         super().__init__()  # Call parent init
+        self.setStyleSheet(APP_STYLESHEET)
+        # Stabilization flag for fullscreen/window state transitions, cleared by a reusable
+        # single-shot timer once the layout settles (set up first: changeEvent may fire early)
+        self._layout_stabilizing: bool = False
+        self._stabilize_timer = QTimer(self)
+        self._stabilize_timer.setSingleShot(True)
+        self._stabilize_timer.setInterval(1000)
+        self._stabilize_timer.timeout.connect(self._on_stabilize_done)
         self.setWindowTitle("FRC Path Editor")
         self.resize(1000, 600)
         self.project_manager = ProjectManager()
@@ -52,7 +221,6 @@ class MainWindow(QMainWindow):
             divider.setFrameShape(QFrame.NoFrame)
             divider.setFixedWidth(1)
             divider.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Expanding)
-            divider.setStyleSheet("QFrame#sidebarDivider { background-color: #3b3b3b; }")
             layout.addWidget(divider)
         except Exception:
             pass
@@ -74,65 +242,135 @@ class MainWindow(QMainWindow):
         self.canvas.request_simulation_rebuild()
 
         # Wire up interactions: sidebar <-> canvas
-        self.sidebar.elementSelected.connect(self.canvas.select_index, Qt.QueuedConnection)
+        # Sidebar -> canvas selection only touches scene selection, so dispatch directly. Canvas -> sidebar
+        # stays queued: it fires from inside the item's mouse press and the sidebar echoes selection back.
+        self.sidebar.elementSelected.connect(self.canvas.select_index)
         self.canvas.elementSelected.connect(self.sidebar.select_index, Qt.QueuedConnection)
         # Ranged constraints preview from sidebar -> canvas overlay
         try:
-            self.sidebar.constraintRangePreviewRequested.connect(lambda key, s, e: self.canvas.show_constraint_range_overlay(key, s, e))
-            self.sidebar.constraintRangePreviewCleared.connect(lambda: self.canvas.clear_constraint_range_overlay())
+            self.sidebar.constraintRangePreviewRequested.connect(self.canvas.show_constraint_range_overlay)
+            self.sidebar.constraintRangePreviewCleared.connect(self.canvas.clear_constraint_range_overlay)
         except Exception:
             pass
 
         # Sidebar changes -> canvas refresh
-        self.sidebar.modelChanged.connect(self.canvas.refresh_from_model)
-        self.sidebar.modelChanged.connect(self.canvas.update_handoff_radius_visualizers)
-        self.sidebar.modelChanged.connect(self.canvas.request_simulation_rebuild)
-        self.sidebar.modelStructureChanged.connect(lambda: self.canvas.set_path(self.path))
+        self.sidebar.modelChanged.connect(self._on_sidebar_model_changed)
+        self.sidebar.modelStructureChanged.connect(self._on_structure_changed)
         self.sidebar.modelStructureChanged.connect(self.canvas.request_simulation_rebuild)
-        # Global UI clicks: clear ranged overlay unless the click target is a range-related control
-        try:
-            app = QApplication.instance()
-            if app is not None:
-                app.installEventFilter(self)
-            # Also filter events on the window itself as a fallback
-            self.installEventFilter(self)
-        except Exception:
-            pass
+        # Canvas clicks clear the ranged overlay; sidebar clicks are handled by the sidebar itself
+        self.canvas.viewPressed.connect(self.sidebar.clear_active_preview)
         # Sidebar -> undo management
         self.sidebar.aboutToChange.connect(self._on_sidebar_about_to_change)
         self.sidebar.userActionOccurred.connect(self._on_sidebar_action_committed)
 
         # Canvas interactions -> update model and sidebar
-        self.canvas.elementMoved.connect(self._on_canvas_element_moved, Qt.QueuedConnection)
-        self.canvas.elementRotated.connect(self._on_canvas_element_rotated, Qt.QueuedConnection)
-        # Handle start and end of drags for undo/redo
-        self.canvas.elementSelected.connect(self._on_canvas_element_pressed, Qt.QueuedConnection)
+        # Drag streams are dispatched directly (same GUI thread); the handlers only record the latest
+        # sample and arm the per-frame drain timer, so nothing re-enters the canvas.
+        self.canvas.elementMoved.connect(self._on_canvas_element_moved, Qt.DirectConnection)
+        self.canvas.elementRotated.connect(self._on_canvas_element_rotated, Qt.DirectConnection)
+        # Handle start and end of drags for undo/redo. The press snapshot is taken directly so it
+        # precedes the (direct) move stream; drag-finish handlers may rebuild canvas items, so they
+        # stay queued to run after the item's mouse release returns.
+        self.canvas.elementSelected.connect(self._on_canvas_element_pressed, Qt.DirectConnection)
         self.canvas.elementDragFinished.connect(self._on_canvas_drag_finished, Qt.QueuedConnection)
         self.canvas.rotationDragFinished.connect(self._on_canvas_rotation_finished, Qt.QueuedConnection)
         # Canvas delete key -> sidebar delete current element
-        self.canvas.deleteSelectedRequested.connect(self._delete_selected_element)
-        # Sidebar delete key -> same handler
-        self.sidebar.deleteSelectedRequested.connect(self._delete_selected_element)
+        self.canvas.deleteSelectedRequested.connect(self._delete_selected_element, Qt.UniqueConnection)
+        # Sidebar delete key -> same handler. Both widgets accept the key event, so one keypress
+        # reaches only the focused one
+        self.sidebar.deleteSelectedRequested.connect(self._delete_selected_element, Qt.UniqueConnection)
 
         # Auto-save debounce timer
         self._autosave_timer = QTimer(self)
         self._autosave_timer.setSingleShot(True)
-        self._autosave_timer.setInterval(300)
+        # 1 s debounce: single-shot start() restarts on every edit, so a burst of edits
+        # (typing, nudging, drags) collapses into one write. Overridable via config.
+        self._autosave_timer.setInterval(self.AUTOSAVE_DEBOUNCE_MS_DEFAULT)
         self._autosave_timer.timeout.connect(self._do_autosave)
+        # File writes run on a private single-thread pool, so waiting for one never blocks on
+        # unrelated global pool work; the task is kept referenced until it reports back so its
+        # signals object stays alive
+        self._path_write_pool = QThreadPool(self)
+        self._path_write_pool.setMaxThreadCount(1)
+        self._autosave_task = None
+        self._autosave_rerun = False
+        # True while the "Saving..." state is displayed; repeat schedules skip restyling the widgets
+        self._autosave_indicator_shown = False
+
+        # Rotation clamp bounds converted once from the sidebar's degree metadata
+        rot_lo_deg, rot_hi_deg = SPINNER_METADATA['rotation_degrees']['range']
+        self._rot_bounds_rad = (math.radians(rot_lo_deg), math.radians(rot_hi_deg))
+
+        # Per-index nearest translation/waypoint before/after (-1 if none); built on first use and
+        # dropped on structural edits (modelStructureChanged, undo/redo, path swap)
+        self._anchor_prev = None
+        self._anchor_next = None
+
+        # Per-type handlers for canvas drag/rotate updates (avoids isinstance chains per mouse move)
+        self._move_handlers = {
+            TranslationTarget: self._move_translation,
+            RotationTarget: self._move_rotation,
+            Waypoint: self._move_waypoint,
+        }
+        self._rotate_handlers = {
+            RotationTarget: self._rotate_rotation_target,
+            Waypoint: self._rotate_waypoint,
+        }
+
+        # Latest canvas drag/rotate value per element index, applied on a ~60 Hz drain tick
+        self._pending_moves = {}
+        self._pending_rotations = {}
+        # Last raw sample per signal; reset on press so a new gesture always applies its first sample
+        self._last_move_sample = None
+        self._last_rotate_sample = None
+        self._drag_drain_timer = QTimer(self)
+        self._drag_drain_timer.setSingleShot(True)
+        self._drag_drain_timer.setInterval(16)
+        self._drag_drain_timer.timeout.connect(self._drain_pending_drag)
+
+        # Undo recording: (description, element index, pre-change snapshot, owned) committed once edits
+        # go quiet, so a burst of identical edits to one element becomes a single undo entry
+        self._pending_undo = None
+        self._undo_commit_timer = QTimer(self)
+        self._undo_commit_timer.setSingleShot(True)
+        self._undo_commit_timer.setInterval(150)
+        self._undo_commit_timer.timeout.connect(self._flush_pending_undo)
+
+        # Coalesce sidebar refresh + sim rebuild while a config spinner is being dragged
+        self._config_refresh_timer = QTimer(self)
+        self._config_refresh_timer.setSingleShot(True)
+        self._config_refresh_timer.setInterval(50)
+        self._config_refresh_timer.timeout.connect(self._refresh_after_config_change)
 
         # Hook autosave on model changes
         self.sidebar.modelChanged.connect(self._schedule_autosave)
         self.sidebar.modelStructureChanged.connect(self._schedule_autosave)
-        self.canvas.elementDragFinished.connect(self._schedule_autosave)
+        # Between press and release autosave is held off; the finish handlers schedule it once
+        self._drag_active = False
+        # Edit counter for the open path and its value when last saved (or loaded); autosave
+        # compares the two instead of encoding and hashing an unchanged model
+        self._model_epoch = 0
+        self._saved_epoch = 0
+        self._autosave_epoch = 0
+        # Pre-gesture (index, element clone) or path snapshot for undo, taken on canvas press
+        self._gesture_start_state = None
         
         # Hook undo/redo for sidebar changes - simple approach to capture state before changes
         self.sidebar.elementSelected.connect(self._on_element_selected_for_undo)
 
+        # Path dialogs are built on first use and reused afterwards
+        self._delete_path_dialog = None
+        self._delete_path_list = None
+        self._path_selection_dialog = None
+        self._path_selection_list = None
+
         # Menu bar already built earlier
         
         # Create status bar for current path display
         self.statusBar = self.statusBar()
         self.statusBar.showMessage("No path loaded")
+        # (has path, current path file, project dir) last rendered by _update_current_path_display
+        self._display_cache_key = None
 
         # Create autosave status widget in status bar (right side)
         self.autosave_status_widget = QLabel("Saved")
@@ -162,8 +400,6 @@ class MainWindow(QMainWindow):
         # Startup: load last project or prompt
         QTimer.singleShot(0, self._startup_load)
 
-        # Stabilization flag for fullscreen/window state transitions
-        self._layout_stabilizing: bool = False
         # Track config-edit undo session state
         self._config_undo_recorded: bool = False
         self._config_edit_old_config: dict | None = None
@@ -171,13 +407,8 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(0, self.sidebar.mark_ready)
 
     def _delete_selected_element(self):
-        idx = self.sidebar.get_selected_index()
-        if idx is None:
-            return
-        # Record undo snapshot before deletion
-        old_state = copy.deepcopy(self.path)
-        self.sidebar._on_remove_element(idx)
-        self._record_path_change("Delete element", old_state)
+        # The sidebar brackets the removal with aboutToChange/userActionOccurred, which records undo
+        self.sidebar.remove_selected_element()
 
     def changeEvent(self, event):
         # Detect window state changes (e.g., entering/exiting fullscreen) and
@@ -188,62 +419,16 @@ class MainWindow(QMainWindow):
                 self.sidebar.set_suspended(True)
             except Exception:
                 pass
-            # Clear after a short delay once layout settles
-            def _clear():
-                setattr(self, '_layout_stabilizing', False)
-                try:
-                    self.sidebar.set_suspended(False)
-                except Exception:
-                    pass
-            QTimer.singleShot(1000, _clear)
+            # Clear after a short delay once layout settles (restarts on repeated changes)
+            self._stabilize_timer.start()
         super().changeEvent(event)
 
-
-
-    def eventFilter(self, obj, event):
+    def _on_stabilize_done(self):
+        self._layout_stabilizing = False
         try:
-            if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick):
-                # If click is not within a range-related control in the sidebar, clear overlay
-                target_widget = obj if isinstance(obj, QWidget) else None
-                # Walk up parent chain to see if any ancestor is range-related
-                def _belongs_to_range_controls(widget: QWidget) -> bool:
-                    try:
-                        if widget is None:
-                            return False
-                        # If click lands inside the sidebar's elements list, this is unrelated
-                        try:
-                            if hasattr(self.sidebar, 'points_list') and self.sidebar.points_list is not None:
-                                pl = self.sidebar.points_list
-                                curr = widget
-                                steps = 0
-                                max_steps = 100  # Reasonable limit to prevent infinite loops
-                                while curr is not None and steps < max_steps:
-                                    if curr is pl:
-                                        return False
-                                    curr = curr.parent() if hasattr(curr, 'parent') else None
-                                    steps += 1
-                        except Exception:
-                            pass
-                        if hasattr(self.sidebar, 'is_widget_range_related') and callable(self.sidebar.is_widget_range_related):
-                            curr = widget
-                            steps = 0
-                            max_steps = 100  # Reasonable limit to prevent infinite loops
-                            while curr is not None and steps < max_steps:
-                                if self.sidebar.is_widget_range_related(curr):
-                                    return True
-                                curr = curr.parent() if hasattr(curr, 'parent') else None
-                                steps += 1
-                    except Exception:
-                        return False
-                    return False
-                if not _belongs_to_range_controls(target_widget):
-                    try:
-                        self.sidebar.clear_active_preview()
-                    except Exception:
-                        pass
+            self.sidebar.set_suspended(False)
         except Exception:
             pass
-        return super().eventFilter(obj, event)
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -252,256 +437,168 @@ class MainWindow(QMainWindow):
 
     # ---------------- Menu Bar ----------------
     def _build_menu_bar(self):
+        # menuBar() creates and installs the bar on first call; keep the reference
         bar: QMenuBar = self.menuBar()
+        self._menu_bar = bar
         # Ensure menu bar is visible
         bar.setVisible(True)
         bar.setNativeMenuBar(False)  # Force Qt menu bar instead of native macOS menu
-        # Style to visually align with the app's dark UI
-        try:
-            bar.setStyleSheet(
-                """
-                QMenuBar {
-                    background-color: #2f2f2f;
-                    border: none;
-                    border-bottom: 1px solid #4a4a4a;
-                    padding: 1px 6px;
-                    color: #eeeeee;
-                    font-size: 13px;
-                }
-                QMenuBar::item {
-                    background: transparent;
-                    padding: 3px 6px;
-                    margin: 0px 2px;
-                    border-radius: 4px;
-                    border-left: 1px solid #3b3b3b; /* slim vertical separator */
-                }
-                QMenuBar::item:selected {
-                    background: #555555;
-                }
-                QMenuBar::item:pressed {
-                    background: #666666;
-                }
-
-                QMenu {
-                    background-color: #242424;
-                    border: 1px solid #3f3f3f;
-                    color: #f0f0f0;
-                    padding: 3px 0;
-                }
-                QMenu::item {
-                    padding: 3px 10px;
-                    margin: 1px 3px;
-                    border-radius: 3px;
-                }
-                QMenu::item:selected {
-                    background: #555555;
-                }
-                QMenu::separator {
-                    height: 1px;
-                    margin: 2px 6px; /* slim horizontal spacers */
-                    background: #3b3b3b;
-                }
-                QMenu::indicator {
-                    width: 6px;
-                    height: 6px;
-                    margin-right: 10px;
-                    margin-left: 4px;
-                }
-                QMenu::item {
-                    padding-right: 15px;
-                }
-                QMenu::item:selected {
-                    background: #555555;
-                }
-                """
-            )
-        except Exception:
-            pass
-        
-        # Project menu - for opening and managing projects
-        project_menu: QMenu = bar.addMenu("Project")
-        self.action_open_project = QAction("Open Project…", self)
-        self.action_open_project.triggered.connect(self._action_open_project)
-        project_menu.addAction(self.action_open_project)
-        project_menu.addSeparator()
-        
-        # Recent Projects submenu
-        self.menu_recent_projects: QMenu = project_menu.addMenu("Recent Projects")
-        self.menu_recent_projects.aboutToShow.connect(self._populate_recent_projects)
-        
-        # Path menu - for managing paths
-        path_menu: QMenu = bar.addMenu("Path")
-        
-        # Current Path display (read-only)
-        self.action_current_path = QAction("Current: (No Path)", self)
-        self.action_current_path.setEnabled(False)  # Make it read-only
-        path_menu.addAction(self.action_current_path)
-        
-        path_menu.addSeparator()  # Add a separator line
-        
-        # Load Path submenu (dynamic)
-        self.menu_load_path: QMenu = path_menu.addMenu("Load Path")
-        self.menu_load_path.aboutToShow.connect(self._populate_load_path_menu)
-        path_menu.addSeparator()
-
-        # Create New Path action
-        self.action_new_path = QAction("Create New Path", self)
-        self.action_new_path.triggered.connect(self._action_create_new_path)
-        path_menu.addAction(self.action_new_path)
-        path_menu.addSeparator()
-
-        # Save As…
-        self.action_save_as = QAction("Save Path As…", self)
-        self.action_save_as.triggered.connect(self._action_save_as)
-        path_menu.addAction(self.action_save_as)
-        path_menu.addSeparator()
-        
-        # Rename Path action
-        self.action_rename_path = QAction("Rename Path…", self)
-        self.action_rename_path.triggered.connect(self._action_rename_path)
-        path_menu.addAction(self.action_rename_path)
-        path_menu.addSeparator()
-        
-        # Delete Path action (opens dialog)
-        self.action_delete_path = QAction("Delete Paths…", self)
-        self.action_delete_path.triggered.connect(self._show_delete_path_dialog)
-        path_menu.addAction(self.action_delete_path)
-        
-        # Edit menu - for undo/redo (placed after Path, before Settings)
-        edit_menu: QMenu = bar.addMenu("Edit")
-        
-        # Create undo/redo actions with shortcuts and small icons
-        self.action_undo = QAction(self._create_arrow_icon("undo", 12), "Undo", self)
-        self.action_undo.setShortcut(QKeySequence.Undo)  # Use standard undo shortcut
-        self.action_undo.triggered.connect(self._action_undo)
-        self.action_undo.setEnabled(False)  # Will be enabled when undo is available
-        edit_menu.addAction(self.action_undo)
-        edit_menu.addSeparator()
         
-        self.action_redo = QAction(self._create_arrow_icon("redo", 12), "Redo", self)
-        self.action_redo.setShortcut(QKeySequence.Redo)  # Use standard redo shortcut
-        self.action_redo.triggered.connect(self._action_redo)
-        self.action_redo.setEnabled(False)  # Will be enabled when redo is available
-        edit_menu.addAction(self.action_redo)
-        
-        # Settings menu - for configuration
-        settings_menu: QMenu = bar.addMenu("Settings")
-        self.action_edit_config = QAction("Edit Config…", self)
-        self.action_edit_config.triggered.connect(self._action_edit_config)
-        settings_menu.addAction(self.action_edit_config)
-        
-        # Also add actions to main window to ensure shortcuts work
-        self.addAction(self.action_undo)
-        self.addAction(self.action_redo)
-        
-        # Force menu bar to be visible and sized properly
-        menu_bar = self.menuBar()
-        menu_bar.setVisible(True)
-        menu_bar.show()
-        menu_bar.setMinimumHeight(30)
-        menu_bar.setMaximumHeight(40)
-        
-        # Try different approaches to force visibility
-        self.setMenuBar(menu_bar)  # Explicitly set the menu bar
-        menu_bar.raise_()  # Bring to front
-        
-        # Debug: Try to force a repaint
-        menu_bar.update()
-        self.update()
+        # Menus are built from _MENU_SPEC; slots are connected at QAction construction
+        for menu_title, entries in self._MENU_SPEC:
+            menu: QMenu = bar.addMenu(menu_title)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                kind, attr, label, slot = entry
+                if kind == "submenu":
+                    # Dynamic submenu, filled when shown
+                    submenu: QMenu = menu.addMenu(label)
+                    submenu.aboutToShow.connect(getattr(self, slot))
+                    setattr(self, attr, submenu)
+                    continue
+                if slot is None:
+                    # Read-only display entry
+                    action = QAction(label, self)
+                    action.setEnabled(False)
+                else:
+                    action = QAction(label, self, triggered=getattr(self, slot))
+                menu.addAction(action)
+                setattr(self, attr, action)
+        self._recent_projects_menu_key = None
+        self._load_path_menu_key = None
+        # Load Path entries by filename, and the one hidden because it is the open path
+        self._load_path_actions = {}
+        self._load_path_hidden = None
+        # One slot per dynamic submenu; each entry carries its target in QAction.data()
+        self.menu_recent_projects.triggered.connect(self._on_recent_project_triggered)
+        self.menu_load_path.triggered.connect(self._on_load_path_triggered)
+
+        # Undo/redo: standard shortcuts and small icons; enabled when history is available
+        self.action_undo.setIcon(self._create_arrow_icon("undo", 12))
+        self.action_undo.setShortcut(QKeySequence.Undo)
+        self.action_undo.setEnabled(False)
+        self.action_redo.setIcon(self._create_arrow_icon("redo", 12))
+        self.action_redo.setShortcut(QKeySequence.Redo)
+        self.action_redo.setEnabled(False)
+
+        bar.setMinimumHeight(30)
+        bar.setMaximumHeight(40)
 
     def _create_arrow_icon(self, direction: str, size: int = 16) -> QIcon:
-        """Create a small arrow icon for undo/redo buttons."""
+        """Return the (cached) arrow icon for undo/redo buttons."""
         try:
-            pixmap = QPixmap(size, size)
-            pixmap.fill(Qt.transparent)
-            painter = QPainter(pixmap)
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            # Set up pen and brush - smaller line width for delicate arrows
-            pen = QPen(QColor("#333333"), 1)
-            brush = QBrush(QColor("#333333"))
-            painter.setPen(pen)
-            painter.setBrush(brush)
-            
-            # Create simple arrow shape based on direction
-            center_x, center_y = size // 2, size // 2
-            arrow_size = size // 4  # Much smaller arrows
-            
-            if direction == "undo":  # Left arrow
-                arrow = QPolygon([
-                    QPoint(center_x - arrow_size, center_y),
-                    QPoint(center_x + arrow_size//2, center_y - arrow_size//2),
-                    QPoint(center_x + arrow_size//2, center_y - arrow_size//4),
-                    QPoint(center_x, center_y),
-                    QPoint(center_x + arrow_size//2, center_y + arrow_size//4),
-                    QPoint(center_x + arrow_size//2, center_y + arrow_size//2)
-                ])
-            else:  # "redo" - Right arrow
-                arrow = QPolygon([
-                    QPoint(center_x + arrow_size, center_y),
-                    QPoint(center_x - arrow_size//2, center_y - arrow_size//2),
-                    QPoint(center_x - arrow_size//2, center_y - arrow_size//4),
-                    QPoint(center_x, center_y),
-                    QPoint(center_x - arrow_size//2, center_y + arrow_size//4),
-                    QPoint(center_x - arrow_size//2, center_y + arrow_size//2)
-                ])
-            
-            painter.drawPolygon(arrow)
-            painter.end()
-            
-            return QIcon(pixmap)
+            dpr = float(self.devicePixelRatioF())
         except Exception:
-            # Return empty icon on error
-            return QIcon()
-
+            dpr = 1.0
+        return _arrow_icon(direction, size, dpr)
 
+    def _reset_menu_actions(self, menu: QMenu):
+        # Actions are parented to the window, so QMenu.clear() alone would leak them
+        for act in menu.actions():
+            menu.removeAction(act)
+            act.deleteLater()
 
     def _populate_load_path_menu(self):
-        self.menu_load_path.clear()
-        files = self.project_manager.list_paths()
-        if not files:
-            a = QAction("(No paths)", self)
-            a.setEnabled(False)
-            self.menu_load_path.addAction(a)
-            return
-        for fname in files:
-            # Skip the currently opened path
-            if fname == self.project_manager.current_path_file:
-                continue
-            act = QAction(fname, self)
-            act.triggered.connect(lambda checked=False, f=fname: self._load_path_file(f))
-            self.menu_load_path.addAction(act)
+        # Rebuild only when the paths directory listing changed: dir mtime for outside edits, the
+        # project manager's generation for our own saves/deletes/renames
+        pm = self.project_manager
+        paths_dir = pm.get_paths_dir()
+        try:
+            mtime = os.stat(paths_dir).st_mtime_ns if paths_dir else None
+        except OSError:
+            mtime = None
+        key = (paths_dir, mtime, pm.paths_generation)
+        if mtime is None or key != self._load_path_menu_key:
+            self._load_path_menu_key = key
+            self._reset_menu_actions(self.menu_load_path)
+            self._load_path_actions = {}
+            self._load_path_hidden = None
+            files = self.project_manager.list_paths()
+            if not files:
+                a = QAction("(No paths)", self)
+                a.setEnabled(False)
+                self.menu_load_path.addAction(a)
+                return
+            for fname in files:
+                act = QAction(fname, self)
+                act.setData(fname)
+                self.menu_load_path.addAction(act)
+                self._load_path_actions[fname] = act
+        # Skip the currently opened path: switching paths flips two actions by name instead of
+        # rebuilding the whole menu
+        current = self.project_manager.current_path_file
+        if current != self._load_path_hidden:
+            prev = self._load_path_actions.get(self._load_path_hidden)
+            if prev is not None:
+                prev.setVisible(True)
+            act = self._load_path_actions.get(current)
+            if act is not None:
+                act.setVisible(False)
+            self._load_path_hidden = current
+
+    def _on_load_path_triggered(self, action: QAction):
+        fname = action.data()
+        if fname:
+            self._load_path_file(fname)
 
     def _populate_recent_projects(self):
-        self.menu_recent_projects.clear()
         recents = self.project_manager.recent_projects()
+        key = tuple(recents)
+        if key == self._recent_projects_menu_key:
+            return
+        self._recent_projects_menu_key = key
+        self._reset_menu_actions(self.menu_recent_projects)
         if not recents:
             a = QAction("(No recent projects)", self)
             a.setEnabled(False)
             self.menu_recent_projects.addAction(a)
             return
         for d in recents:
-            label = d
-            act = QAction(label, self)
-            act.triggered.connect(lambda checked=False, dirpath=d: self._open_recent_project(dirpath))
+            act = QAction(d, self)
+            act.setData(d)
             self.menu_recent_projects.addAction(act)
 
+    def _on_recent_project_triggered(self, action: QAction):
+        dirpath = action.data()
+        if dirpath:
+            self._open_recent_project(dirpath)
+
     def _show_delete_path_dialog(self):
         """Show a dialog for selecting and deleting paths"""
         if not self.project_manager.has_valid_project():
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(self, "No Project", "Please open a project first.")
             return
             
         files = self.project_manager.list_paths()
         if not files:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(self, "No Paths", "No paths found to delete.")
             return
         
-        # Create a custom dialog
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QCheckBox, QPushButton, QLabel, QScrollArea, QWidget
-        from PySide6.QtCore import Qt
+
+        dialog = self._ensure_delete_path_dialog()
+        # Only the list entries are refilled; the dialog shell is reused across opens
+        path_list = self._delete_path_list
+        path_list.clear()
+        current_file = self.project_manager.current_path_file
+        for fname in files:
+            item = QListWidgetItem(fname)
+            # The filename is kept as item data; the text may carry a "(Current)" marker
+            item.setData(Qt.UserRole, fname)
+            if fname == current_file:
+                item.setText(f"{fname} (Current)")
+                item.setToolTip("This is the currently open path")
+                item.setBackground(QColor("#332b2b"))
+            path_list.addItem(item)
+
+        # Show dialog
+        dialog.exec()
+
+    def _ensure_delete_path_dialog(self) -> QDialog:
+        """Build the Delete Paths dialog shell once; rows are filled per open."""
+        if self._delete_path_dialog is not None:
+            return self._delete_path_dialog
 
         dialog = QDialog(self)
         dialog.setWindowTitle("Delete Paths")
@@ -514,10 +611,9 @@ class MainWindow(QMainWindow):
                 """
                 QDialog { background-color: #242424; }
                 QLabel { color: #f0f0f0; }
-                QCheckBox { color: #e0e0e0; spacing: 8px; }
-                QScrollArea { background: #242424; border: 1px solid #3f3f3f; border-radius: 6px; }
-                QWidget#pathRow { background: #2a2a2a; border: 1px solid #3b3b3b; border-radius: 6px; }
-                QWidget#pathRow[current="true"] { background: #332b2b; border-color: #7a3b3b; }
+                QListWidget { background: #242424; color: #e0e0e0; border: 1px solid #3f3f3f; border-radius: 6px; padding: 4px; }
+                QListWidget::item { padding: 4px 6px; border-radius: 4px; }
+                QListWidget::item:selected { background: #7a3b3b; color: #ffffff; }
                 QPushButton { background-color: #2f2f2f; color: #f0f0f0; border: 1px solid #4a4a4a; border-radius: 4px; padding: 4px 10px; }
                 QPushButton:hover { background-color: #3a3a3a; }
                 QPushButton:pressed { background-color: #454545; }
@@ -545,50 +641,20 @@ class MainWindow(QMainWindow):
         header_label.setStyleSheet("font-weight: bold; font-size: 14px;")
         layout.addWidget(header_label)
 
-        # Scrollable area for checkboxes
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        try:
-            scroll_layout.setContentsMargins(6, 6, 6, 6)
-            scroll_layout.setSpacing(4)
-        except Exception:
-            pass
-
-        # Create styled rows with checkboxes for each path
-        checkboxes = {}
-        for fname in files:
-            row = QWidget()
-            row.setObjectName("pathRow")
-            if fname == self.project_manager.current_path_file:
-                row.setProperty("current", "true")
-            row_layout = QHBoxLayout(row)
-            row_layout.setContentsMargins(8, 4, 8, 4)
-            row_layout.setSpacing(6)
-
-            cb = QCheckBox(fname)
-            if fname == self.project_manager.current_path_file:
-                cb.setText(f"{fname} (Current)")
-                cb.setToolTip("This is the currently open path")
-
-            checkboxes[fname] = cb
-            row_layout.addWidget(cb)
-            scroll_layout.addWidget(row)
-
-        scroll_widget.setLayout(scroll_layout)
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-        layout.addWidget(scroll_area)
+        # Path list; Ctrl/Shift-click picks several paths at once
+        path_list = QListWidget()
+        path_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        layout.addWidget(path_list)
 
         # Button layout
         button_layout = QHBoxLayout()
 
         # Select All/None buttons
         select_all_btn = QPushButton("Select All")
-        select_all_btn.clicked.connect(lambda: [cb.setChecked(True) for cb in checkboxes.values()])
+        select_all_btn.clicked.connect(path_list.selectAll)
 
         select_none_btn = QPushButton("Select None")
-        select_none_btn.clicked.connect(lambda: [cb.setChecked(False) for cb in checkboxes.values()])
+        select_none_btn.clicked.connect(path_list.clearSelection)
 
         button_layout.addWidget(select_all_btn)
         button_layout.addWidget(select_none_btn)
@@ -597,7 +663,7 @@ class MainWindow(QMainWindow):
         # Delete and Cancel buttons
         delete_btn = QPushButton("Delete Selected")
         delete_btn.setObjectName("deleteBtn")
-        delete_btn.clicked.connect(lambda: self._delete_paths_from_dialog(checkboxes, dialog))
+        delete_btn.clicked.connect(lambda: self._delete_paths_from_dialog(path_list, dialog))
 
         cancel_btn = QPushButton("Cancel")
         cancel_btn.clicked.connect(dialog.reject)
@@ -607,22 +673,26 @@ class MainWindow(QMainWindow):
 
         layout.addLayout(button_layout)
 
-        # Show dialog
-        dialog.exec()
+        self._delete_path_dialog = dialog
+        self._delete_path_list = path_list
+        return dialog
 
     # ---------------- Startup and Actions ----------------
     def _startup_load(self):
         if self.project_manager.load_last_project() and self.project_manager.has_valid_project():
-            # Load config and apply canvas dims
-            cfg = self.project_manager.load_config()
-            self._apply_robot_dims_from_config(cfg)
-            # Config impacts constraints; rebuild sim
-            self.canvas.request_simulation_rebuild()
-            # Load last or first or create
-            path, filename = self.project_manager.load_last_or_first_or_create()
-            self._set_path_model(path)
-            # Update the current path display after startup
-            self._update_current_path_display()
+            # Config dims and the loaded path would each rebuild canvas items; batch them into one
+            self.canvas.begin_batch_update()
+            try:
+                # Config was just read by set_project_dir; apply canvas dims
+                cfg = self.project_manager.config
+                self._apply_robot_dims_from_config(cfg)
+                # Config impacts constraints; rebuild sim
+                self.canvas.request_simulation_rebuild()
+                # Load last or first or create
+                path, filename = self.project_manager.load_last_or_first_or_create()
+                self._set_path_model(path)
+            finally:
+                self.canvas.end_batch_update()
         else:
             # No valid project – show file dialog
             self._action_open_project(force_dialog=True)
@@ -634,6 +704,17 @@ class MainWindow(QMainWindow):
         except Exception:
             length_m, width_m = 0.60, 0.60
         self.canvas.set_robot_dimensions(length_m, width_m)
+        # Every config (re)load goes through here, so pick up the autosave delay as well
+        self._apply_autosave_interval_from_config(cfg)
+
+    def _apply_autosave_interval_from_config(self, cfg):
+        # 0 ms is a valid setting (save on the next event loop turn); only a missing value uses the default
+        value = cfg.get("autosave_debounce_ms")
+        try:
+            interval_ms = int(value) if value is not None else self.AUTOSAVE_DEBOUNCE_MS_DEFAULT
+        except Exception:
+            interval_ms = self.AUTOSAVE_DEBOUNCE_MS_DEFAULT
+        self._autosave_timer.setInterval(max(0, interval_ms))
 
     def _action_open_project(self, force_dialog: bool = False):
         # Always prompt the user to select a project directory. Initialize to current project or home.
@@ -643,28 +724,37 @@ class MainWindow(QMainWindow):
             # User canceled; leave current project/path unchanged
             return
         self.project_manager.set_project_dir(directory)
-        cfg = self.project_manager.load_config()
-        self._apply_robot_dims_from_config(cfg)
-        path, filename = self.project_manager.load_last_or_first_or_create()
-        self._set_path_model(path)
-        # Update the current path display after opening project
-        self._update_current_path_display()
-        self.canvas.request_simulation_rebuild()
+        # Config dims and the new path would each rebuild canvas items; batch them into one
+        self.canvas.begin_batch_update()
+        try:
+            # set_project_dir has already read config.json; don't parse it a second time
+            cfg = self.project_manager.config
+            self._apply_robot_dims_from_config(cfg)
+            path, filename = self.project_manager.load_last_or_first_or_create()
+            self._set_path_model(path)
+            self.canvas.request_simulation_rebuild()
+        finally:
+            self.canvas.end_batch_update()
 
     def _open_recent_project(self, directory: str):
         if not directory:
             return
         self.project_manager.set_project_dir(directory)
-        cfg = self.project_manager.load_config()
-        self._apply_robot_dims_from_config(cfg)
-        path, filename = self.project_manager.load_last_or_first_or_create()
-        self._set_path_model(path)
-        # Update the current path display after opening recent project
-        self._update_current_path_display()
-        self.canvas.request_simulation_rebuild()
+        # Config dims and the new path would each rebuild canvas items; batch them into one
+        self.canvas.begin_batch_update()
+        try:
+            # set_project_dir has already read config.json; don't parse it a second time
+            cfg = self.project_manager.config
+            self._apply_robot_dims_from_config(cfg)
+            path, filename = self.project_manager.load_last_or_first_or_create()
+            self._set_path_model(path)
+            self.canvas.request_simulation_rebuild()
+        finally:
+            self.canvas.end_batch_update()
 
     def _action_undo(self):
         """Perform undo operation."""
+        self._flush_pending_undo()
         command = self.undo_manager.undo()
         if command:
             # Refresh all UI components
@@ -672,6 +762,7 @@ class MainWindow(QMainWindow):
     
     def _action_redo(self):
         """Perform redo operation."""
+        self._flush_pending_undo()
         command = self.undo_manager.redo()
         if command:
             # Refresh all UI components
@@ -699,18 +790,28 @@ class MainWindow(QMainWindow):
     
     def _refresh_after_undo_redo(self):
         """Refresh all UI components after an undo/redo operation."""
-        # Refresh canvas from model
-        self.canvas.set_path(self.path)
-        self.canvas.refresh_from_model()
-        self.canvas.update_handoff_radius_visualizers()
-        self.canvas.request_simulation_rebuild()
+        # The canvas items are rebuilt below, so a drag in progress never sees its release
+        self._cancel_drag()
+        self._invalidate_neighbor_cache()
+        # Batch the canvas: set_path and the robot dims below rebuild items once, and the
+        # simulation is requested once when the batch ends
+        self.canvas.begin_batch_update()
+        try:
+            # set_path rebuilds every item from the model (positions, angles, handoff radii)
+            self.canvas.set_path(self.path)
 
-        # Refresh sidebar
-        self.sidebar.set_path(self.path)
-        self.sidebar.refresh_current_selection()
+            # Refresh sidebar; its list and property panel repaint once when both are done
+            self.sidebar.setUpdatesEnabled(False)
+            try:
+                self.sidebar.set_path(self.path)
+                self.sidebar.refresh_current_selection()
+            finally:
+                self.sidebar.setUpdatesEnabled(True)
 
-        # Apply config changes to canvas
-        self._apply_robot_dims_from_config(self.project_manager.config)
+            # Apply config changes to canvas
+            self._apply_robot_dims_from_config(self.project_manager.config)
+        finally:
+            self.canvas.end_batch_update()
 
         # Update path display
         self._update_current_path_display()
@@ -718,33 +819,72 @@ class MainWindow(QMainWindow):
         # Trigger autosave after undo/redo since the path has changed
         self._schedule_autosave()
     
-    def _record_path_change(self, description: str, old_path: Path = None):
-        """Record a path change in the undo system."""
+    def _record_path_change(self, description: str, old_path: Path = None, owned: bool = False,
+                            index: Optional[int] = None):
+        """Record a path change in the undo system.
+
+        The command is built after the change settles (see _flush_pending_undo). Repeated
+        records with the same description and element index keep the earliest snapshot and
+        merge into one entry; the same edit on another element starts a new entry.
+        Pass owned=True when old_path is a private snapshot nothing else mutates; the command
+        then keeps it instead of cloning it again.
+        """
         if old_path is None:
             # Create a snapshot of the current path before change
-            old_path = copy.deepcopy(self.path)
-        
-        # The new path state will be captured after the change is made
-        def create_command():
-            new_path = copy.deepcopy(self.path)
-            command = PathCommand(
-                path_ref=self.path,
-                old_state=old_path,
-                new_state=new_path,
-                description=description,
-                on_change_callback=self._refresh_after_undo_redo,
-                # Micro-edits from sidebar already updated the live UI, so skip first heavy refresh
-                suppress_first_callback=True if description.startswith("Edit ") or description.startswith("Remove ") or description.startswith("Add ") or description.startswith("Edit Range") else False
-            )
+            old_path = self.path.snapshot()
+            owned = True
+        pending = self._pending_undo
+        if pending is not None and (pending[0], pending[1]) != (description, index):
+            # A different edit starts here; its pre-change state is the previous edit's result.
+            # Push without executing: the live path already holds both edits.
+            self._commit_path_command(pending[0], pending[2], old_path, apply=False, old_owned=pending[3])
+            pending = None
+        if pending is None:
+            self._pending_undo = (description, index, old_path, owned)
+        self._undo_commit_timer.start()
+
+    def _flush_pending_undo(self):
+        """Commit any pending path change as an undo command using the current path state."""
+        self._undo_commit_timer.stop()
+        pending = self._pending_undo
+        if pending is None:
+            return
+        self._pending_undo = None
+        self._commit_path_command(pending[0], pending[2], self.path, old_owned=pending[3])
+
+    def _commit_path_command(self, description: str, old_path: Path, new_path: Path, apply: bool = True, old_owned: bool = False):
+        command = PathCommand(
+            path_ref=self.path,
+            old_state=old_path,
+            new_state=new_path,
+            description=description,
+            on_change_callback=self._refresh_after_undo_redo,
+            # Micro-edits from sidebar already updated the live UI, so skip first heavy refresh.
+            # Pushed (not executed) commands must refresh on their first redo.
+            suppress_first_callback=apply and (description.startswith("Edit ") or description.startswith("Remove ") or description.startswith("Add ") or description.startswith("Edit Range")),
+            # Most edits touch one element; store just that element instead of two full paths
+            patch=single_element_patch(old_path, new_path),
+            adopt_old_state=old_owned
+        )
+        if apply:
             self.undo_manager.execute_command(command)
-        
-        # Defer command creation to next event loop iteration
-        # so the change is applied first
-        QTimer.singleShot(0, create_command)
+        else:
+            self.undo_manager.push_command(command)
+
+    @Slot()
+    def _on_sidebar_model_changed(self):
+        # One slot for sidebar edits instead of three separate connections
+        self.canvas.refresh_from_model()
+        self.canvas.update_handoff_radius_visualizers()
+        self.canvas.request_simulation_rebuild()
+
+    def _on_structure_changed(self):
+        self._invalidate_neighbor_cache()
+        self.canvas.set_path(self.path)
 
     def _on_sidebar_about_to_change(self, description: str):
         """Capture pre-change snapshot for undo before a sidebar-driven edit."""
-        self._sidebar_old_state = copy.deepcopy(self.path)
+        self._sidebar_old_state = self.path.snapshot()
         self._sidebar_action_desc = description
 
     def _on_sidebar_action_committed(self, description: str):
@@ -753,20 +893,33 @@ class MainWindow(QMainWindow):
             old_state = getattr(self, '_sidebar_old_state', None)
             desc = description or getattr(self, '_sidebar_action_desc', "Edit")
             if old_state is not None:
-                self._record_path_change(desc, old_state)
+                # The about-to-change snapshot is private to this edit; hand it over without recloning
+                self._record_path_change(desc, old_state, owned=True, index=self.sidebar.get_selected_index())
+                # The edit has already been applied, so commit now. Value edits ("Edit ...") come in
+                # spinner/slider streams and are left to coalesce on the undo timer.
+                if not desc.startswith("Edit"):
+                    self._flush_pending_undo()
         finally:
-            if hasattr(self, '_sidebar_old_state'):
-                delattr(self, '_sidebar_old_state')
-            if hasattr(self, '_sidebar_action_desc'):
-                delattr(self, '_sidebar_action_desc')
+            self._release_pre_change_state()
+
+    def _release_pre_change_state(self):
+        """Drop the sidebar's pre-change snapshot once it is handed to the undo stack or is stale.
+
+        An aboutToChange without a matching commit (e.g. a rejected type change) would otherwise
+        keep a whole-path snapshot alive until the next sidebar edit.
+        """
+        if hasattr(self, '_sidebar_old_state'):
+            delattr(self, '_sidebar_old_state')
+        if hasattr(self, '_sidebar_action_desc'):
+            delattr(self, '_sidebar_action_desc')
     
     def _record_config_change(self, description: str, old_config: dict = None):
         """Record a config change in the undo system."""
         if old_config is None:
-            old_config = copy.deepcopy(self.project_manager.config)
+            old_config = dict(self.project_manager.config)
         
         def create_command():
-            new_config = copy.deepcopy(self.project_manager.config)
+            new_config = dict(self.project_manager.config)
             command = ConfigCommand(
                 project_manager=self.project_manager,
                 old_config=old_config,
@@ -779,85 +932,101 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(0, create_command)
 
     def _action_edit_config(self):
-        old_config = copy.deepcopy(self.project_manager.config)
+        # Config is a flat dict of scalars, so a shallow copy is a full snapshot
+        old_config = dict(self.project_manager.config)
         # Begin a config-edit session: capture original for undo on first live change
-        self._config_edit_old_config = copy.deepcopy(old_config)
+        # (neither snapshot is mutated, so both names share it)
+        self._config_edit_old_config = old_config
         self._config_undo_recorded = False
-        cfg = self.project_manager.load_config()
-        dlg = ConfigDialog(self, cfg, on_change=self._on_config_live_change)
+        # The in-memory config is authoritative: every change is written through save_config
+        cfg = self.project_manager.config
+        # Imported on first use: the dialog module is not needed to show the main window
+        from .config_dialog import ConfigDialog
+        dlg = ConfigDialog(self, cfg, on_change=self._on_config_live_change, on_change_many=self._on_config_live_change_many)
         result = dlg.exec()
         if result == QDialog.Accepted:
             new_cfg = dlg.get_values()
-            self.project_manager.save_config(new_cfg)
-            # Apply to canvas if robot dims changed
-            self._apply_robot_dims_from_config(self.project_manager.config)
-            # Constraints/gains may change; rebuild sim
-            self.canvas.request_simulation_rebuild()
-            # Sidebar will use defaults from project_manager when adding optionals
-
-            # Refresh sidebar for current selection so defaults/UI reflect changes
-            self.sidebar.refresh_current_selection()
-            
-            # Record the config change for undo/redo as a single grouped entry
-            self._record_config_change("Change Defaults", old_config)
+            current = self.project_manager.config
+            if any(current.get(k) != v for k, v in new_cfg.items()):
+                self.project_manager.save_config(new_cfg)
+            # Nothing changed over the whole session (or edits were reverted): no refresh, no undo entry
+            if self.project_manager.config != old_config:
+                self._config_refresh_timer.stop()
+                # Apply to canvas if robot dims changed
+                self._apply_robot_dims_from_config(self.project_manager.config)
+                # Constraints/gains may change; rebuild sim
+                self.canvas.request_simulation_rebuild()
+                # Sidebar will use defaults from project_manager when adding optionals
+
+                # Refresh sidebar for current selection so defaults/UI reflect changes
+                self.sidebar.refresh_current_selection()
+
+                # Record the config change for undo/redo as a single grouped entry
+                self._record_config_change("Change Defaults", old_config)
         else:
             # User cancelled -> auto-undo all changes by restoring the original snapshot
             try:
                 # Restore original config snapshot
                 if self._config_edit_old_config is not None:
-                    self.project_manager.config = copy.deepcopy(self._config_edit_old_config)
+                    self.project_manager.config = dict(self._config_edit_old_config)
                     self.project_manager.save_config()
                     # Apply any visual impacts
                     self._apply_robot_dims_from_config(self.project_manager.config)
-                    self.canvas.request_simulation_rebuild()
-                    self.sidebar.refresh_current_selection()
+                    self._refresh_after_config_change()
             except Exception:
                 pass
         # Clear session flags after dialog closes
         self._config_edit_old_config = None
         self._config_undo_recorded = False
+        # The dialog is parented to the window, so without this every open would keep one alive
+        dlg.deleteLater()
 
     def _on_config_live_change(self, key: str, value: float):
-        # Persist to config immediately, but do NOT create per-item undo entries
-        self.project_manager.save_config({key: value})
+        self._on_config_live_change_many({key: value})
+
+    def _on_config_live_change_many(self, values: dict):
+        # Drop values equal to what is stored (spinner re-emits, sync_from_config round-trips)
+        current = self.project_manager.config
+        values = {k: v for k, v in values.items() if current.get(k) != v}
+        if not values:
+            return
+        # Persist to config immediately (one write per burst), but do NOT create per-item undo entries
+        self.project_manager.save_config(values)
         # Track that we had at least one live change during this session
         self._config_undo_recorded = True
         
-        if key in ("robot_length_meters", "robot_width_meters"):
+        if "robot_length_meters" in values or "robot_width_meters" in values:
             self._apply_robot_dims_from_config(self.project_manager.config)
-        # Config changes affect simulation constraints/gains; rebuild sim
-        self.canvas.request_simulation_rebuild()
-        # For optional defaults, no immediate changes unless fields are being added later.
-        # Still refresh visible sidebar to reflect any fields that might show defaults.
-        self.sidebar.refresh_current_selection()
+        elif "autosave_debounce_ms" in values:
+            self._apply_autosave_interval_from_config(self.project_manager.config)
+        # Sim rebuild and sidebar refresh run once the spinner goes quiet
+        self._config_refresh_timer.start()
         # If the config dialog is open, keep its spinners in sync with potential external config changes
         try:
+            from .config_dialog import ConfigDialog
             active = self.activeWindow()
             if isinstance(active, ConfigDialog):
                 active.sync_from_config(self.project_manager.config)
         except Exception:
             pass
 
+    def _refresh_after_config_change(self):
+        self._config_refresh_timer.stop()
+        # Config changes affect simulation constraints/gains; rebuild sim
+        self.canvas.request_simulation_rebuild()
+        # For optional defaults, no immediate changes unless fields are being added later.
+        # Still refresh visible sidebar to reflect any fields that might show defaults.
+        self.sidebar.refresh_current_selection()
+
     def _get_config_key_label(self, key: str) -> str:
         """Get a human-readable label for a config key."""
-        labels = {
-            'robot_length_meters': 'Robot Length',
-            'robot_width_meters': 'Robot Width',
-            'max_velocity_meters_per_sec': 'Default Max Velocity',
-            'max_acceleration_meters_per_sec2': 'Default Max Accel',
-            'intermediate_handoff_radius_meters': 'Default Handoff Radius',
-            'max_velocity_deg_per_sec': 'Default Max Rot Vel',
-            'max_acceleration_deg_per_sec2': 'Default Max Rot Accel',
-        }
-        return labels.get(key, key)
+        return _CONFIG_KEY_LABELS.get(key, key)
 
     def _load_path_file(self, filename: str):
         p = self.project_manager.load_path(filename)
         if p is None:
             return
         self._set_path_model(p)
-        # Update the current path display after loading a path
-        self._update_current_path_display()
         self.canvas.request_simulation_rebuild()
 
     def _action_save_as(self):
@@ -868,31 +1037,34 @@ class MainWindow(QMainWindow):
                 return
         base_dir = self.project_manager.get_paths_dir()
         suggested = self.project_manager.current_path_file or "untitled.json"
-        # Use global os for initial join to avoid unbound local
         file_tuple = QFileDialog.getSaveFileName(self, "Save Path As", os.path.join(base_dir, suggested), "JSON Files (*.json)")
         filepath = file_tuple[0]
         if not filepath:
             return
         # Normalize to project paths folder
         try:
-            import os as _os
-            folder, name = _os.path.split(filepath)
-            if _os.path.abspath(folder) != _os.path.abspath(base_dir):
+            folder, name = os.path.split(filepath)
+            if os.path.abspath(folder) != os.path.abspath(base_dir):
                 # Force save into paths dir
                 name = name or suggested
-                filepath = _os.path.join(base_dir, name)
+                filepath = os.path.join(base_dir, name)
         except Exception:
             pass
         # Save
         try:
-            import os as _os
-            filename = _os.path.basename(filepath)
-            self.project_manager.save_path(self.path, filename)
-            # Auto-open the newly saved path
-            self._load_path_file(filename)
+            filename = os.path.basename(filepath)
+            self._wait_for_autosave_write()
+            # The saved file now holds exactly the in-memory model and save_path made it the current
+            # file, so there is nothing to reload: only the path display changes
+            if self.project_manager.save_path(self.path, filename):
+                self._update_current_path_display()
         except Exception:
             pass
 
+    def _paths_path(self, filename: str) -> str:
+        """Full path of a file in the project's paths directory."""
+        return os.path.join(self.project_manager.get_paths_dir(), filename)
+
     def _action_create_new_path(self):
         """Create a new blank path and clear the current model"""
         # Create a new empty path
@@ -902,7 +1074,6 @@ class MainWindow(QMainWindow):
         # If we have a valid project, save it as a new file
         if self.project_manager.has_valid_project():
             # Prompt user for filename
-            from PySide6.QtWidgets import QInputDialog
             filename, ok = QInputDialog.getText(
                 self, "Create New Path", 
                 "Enter path name:", 
@@ -915,12 +1086,12 @@ class MainWindow(QMainWindow):
                     filename += '.json'
                 
                 # Check if file already exists
-                if os.path.exists(os.path.join(self.project_manager.project_dir, "paths", filename)):
-                    from PySide6.QtWidgets import QMessageBox
+                if os.path.exists(self._paths_path(filename)):
                     QMessageBox.warning(self, "File Exists", f"A path named '{filename}' already exists. Please choose a different name.")
                     return
                 
                 # Save the new path
+                self._wait_for_autosave_write()
                 saved_filename = self.project_manager.save_path(new_path, filename)
                 if saved_filename:
                     # Force complete UI refresh after saving
@@ -945,8 +1116,7 @@ class MainWindow(QMainWindow):
                     self._populate_recent_projects()
 
                     # Ensure the menu bar gets updated
-                    if hasattr(self, 'menuBar'):
-                        self.menuBar().update()
+                    self._menu_bar.update()
             else:
                 # User cancelled, just show the empty path without saving
                 pass
@@ -957,22 +1127,17 @@ class MainWindow(QMainWindow):
     def _action_rename_path(self):
         """Rename the currently open path file"""
         if not self.project_manager.has_valid_project():
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(self, "No Project", "Please open a project first.")
             return
             
         if not self.project_manager.current_path_file:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(self, "No Path", "No path is currently open to rename.")
             return
         
         # Get current filename without extension
-        current_name = self.project_manager.current_path_file
-        if current_name.endswith('.json'):
-            current_name = current_name[:-5]
+        current_name = _path_display_name(self.project_manager.current_path_file)
         
         # Prompt user for new filename
-        from PySide6.QtWidgets import QInputDialog
         new_filename, ok = QInputDialog.getText(
             self, "Rename Path", 
             f"Enter new name for '{current_name}':", 
@@ -986,16 +1151,17 @@ class MainWindow(QMainWindow):
             
             # Check if new filename already exists
             if new_filename != self.project_manager.current_path_file:
-                if os.path.exists(os.path.join(self.project_manager.project_dir, "paths", new_filename)):
-                    from PySide6.QtWidgets import QMessageBox
+                if os.path.exists(self._paths_path(new_filename)):
                     QMessageBox.warning(self, "File Exists", f"A path named '{new_filename}' already exists. Please choose a different name.")
                     return
                 
                 # Rename the file
                 try:
-                    old_path = os.path.join(self.project_manager.project_dir, "paths", self.project_manager.current_path_file)
-                    new_path = os.path.join(self.project_manager.project_dir, "paths", new_filename)
+                    self._wait_for_autosave_write()
+                    old_path = self._paths_path(self.project_manager.current_path_file)
+                    new_path = self._paths_path(new_filename)
                     os.rename(old_path, new_path)
+                    self.project_manager.invalidate_paths_listing()
                     
                     # Update the project manager's current path file
                     self.project_manager.current_path_file = new_filename
@@ -1005,20 +1171,17 @@ class MainWindow(QMainWindow):
                     self._update_current_path_display()
                     self._populate_load_path_menu()
                     
-                    from PySide6.QtWidgets import QMessageBox
                     QMessageBox.information(self, "Path Renamed", f"Successfully renamed to '{new_filename}'")
                     
                 except Exception as e:
-                    from PySide6.QtWidgets import QMessageBox
                     QMessageBox.critical(self, "Rename Failed", f"Failed to rename path: {str(e)}")
 
-    def _delete_paths_from_dialog(self, checkboxes: dict, dialog: QDialog):
+    def _delete_paths_from_dialog(self, path_list: QListWidget, dialog: QDialog):
         """Delete the selected paths from the dialog after confirmation"""
-        # Get selected paths from checkboxes
-        selected_paths = [fname for fname, cb in checkboxes.items() if cb.isChecked()]
+        # Selected filenames in list order (selectedItems() returns them in click order)
+        selected_paths = [item.data(Qt.UserRole) for item in sorted(path_list.selectedItems(), key=path_list.row)]
         
         if not selected_paths:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(self, "No Selection", "Please select at least one path to delete.")
             return
         
@@ -1028,7 +1191,6 @@ class MainWindow(QMainWindow):
             current_path_deleted = True
         
         # Show confirmation dialog
-        from PySide6.QtWidgets import QMessageBox
         if len(selected_paths) == 1:
             msg = f"Are you sure you want to delete '{selected_paths[0]}'?"
             if current_path_deleted:
@@ -1046,11 +1208,8 @@ class MainWindow(QMainWindow):
         
         if reply == QMessageBox.Yes:
             # Delete the selected paths
-            deleted_count = 0
-            
-            for path_name in selected_paths:
-                if self.project_manager.delete_path(path_name):
-                    deleted_count += 1
+            self._wait_for_autosave_write()
+            deleted_count = self.project_manager.delete_paths(selected_paths)
             
             # Show result
             if deleted_count == 1:
@@ -1072,14 +1231,12 @@ class MainWindow(QMainWindow):
         """Handle the case where the currently open path was deleted"""
         # Clear the current path
         self._set_path_model(Path())
-        self._update_current_path_display()
         
         # Check if there are other paths available
         available_paths = self.project_manager.list_paths()
         
         if not available_paths:
             # No paths left - just inform the user
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.information(
                 self, 
                 "No Paths Available", 
@@ -1089,7 +1246,6 @@ class MainWindow(QMainWindow):
             return
         
         # Ask user if they want to load another path
-        from PySide6.QtWidgets import QMessageBox
         reply = QMessageBox.question(
             self,
             "Current Path Deleted",
@@ -1117,9 +1273,22 @@ class MainWindow(QMainWindow):
         if not available_paths:
             return
         
-        # Create a simple selection dialog
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget, QListWidgetItem
-        from PySide6.QtCore import Qt
+        dialog = self._ensure_path_selection_dialog()
+        path_list = self._path_selection_list
+        path_list.clear()
+        path_list.addItems(available_paths)
+        
+        # Select the first item by default
+        if path_list.count() > 0:
+            path_list.setCurrentRow(0)
+        
+        # Show dialog
+        dialog.exec()
+
+    def _ensure_path_selection_dialog(self) -> QDialog:
+        """Build the path selection dialog once; its list is refilled per open."""
+        if self._path_selection_dialog is not None:
+            return self._path_selection_dialog
         
         dialog = QDialog(self)
         dialog.setWindowTitle("Select Path to Load")
@@ -1133,16 +1302,8 @@ class MainWindow(QMainWindow):
         header_label.setStyleSheet("font-weight: bold; font-size: 14px;")
         layout.addWidget(header_label)
         
-        # List of available paths
+        # List of available paths (filled by _show_path_selection_dialog)
         path_list = QListWidget()
-        for path_name in available_paths:
-            item = QListWidgetItem(path_name)
-            path_list.addItem(item)
-        
-        # Select the first item by default
-        if path_list.count() > 0:
-            path_list.setCurrentRow(0)
-        
         layout.addWidget(path_list)
         
         # Button layout
@@ -1161,15 +1322,15 @@ class MainWindow(QMainWindow):
         button_layout.addWidget(cancel_btn)
         
         layout.addLayout(button_layout)
-        
-        # Show dialog
-        dialog.exec()
+
+        self._path_selection_dialog = dialog
+        self._path_selection_list = path_list
+        return dialog
 
     def _load_selected_path_from_dialog(self, path_list, dialog):
         """Load the selected path from the path selection dialog"""
         current_item = path_list.currentItem()
         if not current_item:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "No Selection", "Please select a path to load.")
             return
         
@@ -1179,239 +1340,371 @@ class MainWindow(QMainWindow):
         path = self.project_manager.load_path(selected_path)
         if path is not None:
             self._set_path_model(path)
-            self._update_current_path_display()
             dialog.accept()
         else:
-            from PySide6.QtWidgets import QMessageBox
             QMessageBox.critical(self, "Error", f"Failed to load path '{selected_path}'.")
 
     def _set_path_model(self, path: Path):
+        # Pending undo entries refer to the outgoing path
+        self._flush_pending_undo()
+        # Pre-change captures of the outgoing path can no longer be recorded
+        self._cancel_drag()
+        self._release_pre_change_state()
         self.path = path
-        self.sidebar.set_path(self.path)
-        self.canvas.set_path(self.path)
+        # A freshly set path matches its file (or is about to be saved explicitly)
+        self._saved_epoch = self._model_epoch
+        self._invalidate_neighbor_cache()
+        # Swap both views in one batch: the sidebar repaints once after its list is refilled and
+        # the canvas rebuilds items and requests the simulation (new path) once at batch end
+        self.canvas.begin_batch_update()
+        self.sidebar.setUpdatesEnabled(False)
+        try:
+            self.sidebar.set_path(self.path)
+            self.canvas.set_path(self.path)
+        finally:
+            self.sidebar.setUpdatesEnabled(True)
+            self.canvas.end_batch_update()
         # Update the current path display
         self._update_current_path_display()
         # Only autosave if this is a new path being created, not when loading existing paths
         # The autosave will be triggered by user actions (modelChanged, modelStructureChanged, etc.)
-        # New path -> rebuild simulation
-        self.canvas.request_simulation_rebuild()
 
     def _update_current_path_display(self):
         """Update the current path display in the menu, window title, and status bar"""
-        if hasattr(self, 'action_current_path'):
-            if self.project_manager.has_valid_project() and self.project_manager.current_path_file:
-                # Show the current path filename
-                path_name = self.project_manager.current_path_file
-                if path_name.endswith('.json'):
-                    path_name = path_name[:-5]  # Remove .json extension for display
-                self.action_current_path.setText(f"Current: {path_name}")
-                
-                # Update window title to show current project and path
-                project_name = os.path.basename(self.project_manager.project_dir)
-                self.setWindowTitle(f"FRC Path Planning - {project_name} - {path_name}")
-                
-                # Update status bar
-                if hasattr(self, 'statusBar'):
-                    self.statusBar.showMessage(f"Current Path: {path_name} | Project: {project_name}")
-            else:
-                # No project or no current path
-                self.action_current_path.setText("Current: (No Path)")
-                self.setWindowTitle("FRC Path Planning")
-                
-                # Update status bar
-                if hasattr(self, 'statusBar'):
-                    self.statusBar.showMessage("No path loaded")
+        # action_current_path is created in _build_menu_bar and the status bar in __init__,
+        # both before any path can be loaded
+        pm = self.project_manager
+        has_path = pm.has_valid_project() and bool(pm.current_path_file)
+        key = (has_path, pm.current_path_file, pm.project_dir)
+        # Inputs unchanged -> the menu text, title and status message would be identical
+        if key == self._display_cache_key:
+            return
+        self._display_cache_key = key
+        if has_path:
+            # Show the current path filename
+            path_name = _path_display_name(pm.current_path_file)
+            self.action_current_path.setText(f"Current: {path_name}")
+            
+            # Update window title to show current project and path
+            project_name = os.path.basename(pm.project_dir)
+            self.setWindowTitle(f"FRC Path Planning - {project_name} - {path_name}")
+            
+            # Update status bar
+            self.statusBar.showMessage(f"Current Path: {path_name} | Project: {project_name}")
+        else:
+            # No project or no current path
+            self.action_current_path.setText("Current: (No Path)")
+            self.setWindowTitle("FRC Path Planning")
+            
+            # Update status bar
+            self.statusBar.showMessage("No path loaded")
 
     def _on_canvas_element_pressed(self, index: int):
         """Called when an element is first pressed for drag/rotate. Snapshot for undo grouping."""
-        self._drag_start_state = copy.deepcopy(self.path)
-        self._rotate_start_state = copy.deepcopy(self.path)
+        self._drain_pending_drag()
+        self._drag_active = True
+        self._last_move_sample = None
+        self._last_rotate_sample = None
+        # Most gestures only edit the pressed element, so keep (index, clone of that element) rather than
+        # a whole-path snapshot; whichever finish handler fires (drag or rotate) consumes it
+        elements = self.path.path_elements
+        if not 0 <= index < len(elements):
+            self._gesture_start_state = None
+        elif isinstance(elements[index], (TranslationTarget, Waypoint)) and any(type(e) is RotationTarget for e in elements):
+            # Releasing an anchor re-derives the t_ratio of rotation targets around it, so undo needs them too
+            self._gesture_start_state = self.path.snapshot()
+        else:
+            self._gesture_start_state = (index, clone_element(elements[index]))
+
+    def _gesture_old_path(self, start_state) -> Path:
+        """Rebuild the pre-gesture path from an (index, old element) delta, or return a full snapshot.
+
+        A delta shares the untouched elements with the live path; PathCommand clones (or patches) on
+        commit. Must run before any reordering, while only the pressed element differs.
+        """
+        if isinstance(start_state, Path):
+            return start_state
+        index, old_element = start_state
+        elements = list(self.path.path_elements)
+        if 0 <= index < len(elements):
+            elements[index] = old_element
+        return Path(elements, self.path.constraints, self.path.ranged_constraints)
     
     def _on_element_selected_for_undo(self, index: int):
         """Selection changes should not create undo entries; do nothing here."""
         return
 
+    @Slot(int, float, float)
     def _on_canvas_element_moved(self, index: int, x_m: float, y_m: float):
         # Suppress during window state transitions to avoid re-entrant churn
         if getattr(self, '_layout_stabilizing', False):
             return
-        if index < 0 or index >= len(self.path.path_elements):
+        # Re-emits of the sample we just queued (jitter that lands on the same point) change nothing
+        sample = (index, x_m, y_m)
+        if sample == self._last_move_sample:
             return
+        self._last_move_sample = sample
+        # Only record the latest position; the drain timer applies it at most once per frame
+        self._pending_moves[index] = (x_m, y_m)
+        if not self._drag_drain_timer.isActive():
+            self._drag_drain_timer.start()
+
+    def _cancel_drag(self):
+        """Drop an in-progress canvas gesture whose items are being replaced (its release will not arrive)."""
+        self._drag_drain_timer.stop()
+        self._pending_moves.clear()
+        self._pending_rotations.clear()
+        self._gesture_start_state = None
+        # Otherwise autosave would stay held off for the rest of the session
+        self._drag_active = False
+
+    def _drain_pending_drag(self):
+        """Apply the latest queued canvas move/rotate per element. Safe to call when nothing is pending."""
+        self._drag_drain_timer.stop()
+        moves, self._pending_moves = self._pending_moves, {}
+        rotations, self._pending_rotations = self._pending_rotations, {}
+        changed = False
+        for index, (x_m, y_m) in moves.items():
+            changed |= self._apply_canvas_move(index, x_m, y_m)
+        for index, radians in rotations.items():
+            changed |= self._apply_canvas_rotation(index, radians)
+        # The drain already runs at most once per frame, so the sidebar values refresh in the same
+        # wakeup rather than on a second frame timer
+        if changed:
+            self.sidebar.update_current_values_only()
+
+    def _apply_canvas_move(self, index: int, x_m: float, y_m: float) -> bool:
+        if index < 0 or index >= len(self.path.path_elements):
+            return False
         
         # Clamp via sidebar metadata to keep UI and model consistent
-        x_m = clamp_from_metadata('x_meters', float(x_m))
-        y_m = clamp_from_metadata('y_meters', float(y_m))
+        x_m = float(x_m)
+        y_m = float(y_m)
+        x_m = _X_MIN if x_m < _X_MIN else (_X_MAX if x_m > _X_MAX else x_m)
+        y_m = _Y_MIN if y_m < _Y_MIN else (_Y_MAX if y_m > _Y_MAX else y_m)
         elem = self.path.path_elements[index]
-        if isinstance(elem, TranslationTarget):
-            elem.x_meters = x_m
-            elem.y_meters = y_m
-        elif isinstance(elem, RotationTarget):
-            # Compute t_ratio from drag position and neighbor anchors
-            prev_pos = None
-            for i in range(index - 1, -1, -1):
-                e = self.path.path_elements[i]
-                if isinstance(e, TranslationTarget):
-                    prev_pos = (e.x_meters, e.y_meters)
-                    break
-                if isinstance(e, Waypoint):
-                    prev_pos = (e.translation_target.x_meters, e.translation_target.y_meters)
-                    break
-            next_pos = None
-            for i in range(index + 1, len(self.path.path_elements)):
-                e = self.path.path_elements[i]
-                if isinstance(e, TranslationTarget):
-                    next_pos = (e.x_meters, e.y_meters)
-                    break
-                if isinstance(e, Waypoint):
-                    next_pos = (e.translation_target.x_meters, e.translation_target.y_meters)
-                    break
-            if prev_pos is not None and next_pos is not None:
-                ax, ay = prev_pos
-                bx, by = next_pos
-                dx = bx - ax
-                dy = by - ay
-                denom = dx * dx + dy * dy
-                if denom > 0.0:
-                    t = ((x_m - ax) * dx + (y_m - ay) * dy) / denom
-                    if t < 0.0:
-                        t = 0.0
-                    elif t > 1.0:
-                        t = 1.0
-                    elem.t_ratio = float(t)
-        elif isinstance(elem, Waypoint):
-            elem.translation_target.x_meters = x_m
-            elem.translation_target.y_meters = y_m
-            # Waypoint rotation position is ratio-based; do not force x/y here
-
-        self.sidebar.update_current_values_only()
+        handler = self._move_handlers.get(type(elem))
+        # Handlers report whether the model actually changed; pinned/no-op moves skip the refresh
+        if handler is None or not handler(index, elem, x_m, y_m):
+            return False
+
+        self._model_epoch += 1
         # defer autosave until drag finished; handled by elementDragFinished
+        return True
+
+    def _move_translation(self, index: int, elem: TranslationTarget, x_m: float, y_m: float) -> bool:
+        if elem.x_meters == x_m and elem.y_meters == y_m:
+            return False
+        elem.x_meters = x_m
+        elem.y_meters = y_m
+        return True
+
+    def _move_rotation(self, index: int, elem: RotationTarget, x_m: float, y_m: float) -> bool:
+        # Compute t_ratio from drag position and neighbor anchors
+        prev_pos, next_pos = self._anchor_positions(index)
+        if prev_pos is None or next_pos is None:
+            return False
+        t = self._project_t_ratio(prev_pos[0], prev_pos[1], next_pos[0], next_pos[1], x_m, y_m)
+        if t is None or elem.t_ratio == t:
+            return False
+        elem.t_ratio = t
+        return True
+
+    @staticmethod
+    def _project_t_ratio(ax: float, ay: float, bx: float, by: float, px: float, py: float) -> Optional[float]:
+        """Clamped [0, 1] ratio of (px, py) projected onto segment a->b; None for a zero-length segment."""
+        dx = bx - ax
+        dy = by - ay
+        denom = dx * dx + dy * dy
+        if denom <= 0.0:
+            return None
+        t = ((px - ax) * dx + (py - ay) * dy) / denom
+        return 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+
+    def _move_waypoint(self, index: int, elem: Waypoint, x_m: float, y_m: float) -> bool:
+        tt = elem.translation_target
+        if tt.x_meters == x_m and tt.y_meters == y_m:
+            return False
+        tt.x_meters = x_m
+        tt.y_meters = y_m
+        # Waypoint rotation position is ratio-based; do not force x/y here
+        return True
+
+    def _rotate_rotation_target(self, elem: RotationTarget, radians: float) -> bool:
+        if elem.rotation_radians == radians:
+            return False
+        elem.rotation_radians = radians
+        # Name the in-progress action for UI clarity
+        try:
+            self.action_undo.setText("Undo " + _ROTATE_LABELS[RotationTarget])
+        except Exception:
+            pass
+        return True
 
+    def _rotate_waypoint(self, elem: Waypoint, radians: float) -> bool:
+        rt = elem.rotation_target
+        if rt.rotation_radians == radians:
+            return False
+        rt.rotation_radians = radians
+        try:
+            self.action_undo.setText("Undo " + _ROTATE_LABELS[Waypoint])
+        except Exception:
+            pass
+        return True
+
+    @Slot(int, float)
     def _on_canvas_element_rotated(self, index: int, radians: float):
         # Suppress during window state transitions to avoid re-entrant churn
         if getattr(self, '_layout_stabilizing', False):
             return
-        if index < 0 or index >= len(self.path.path_elements):
+        sample = (index, radians)
+        if sample == self._last_rotate_sample:
             return
+        self._last_rotate_sample = sample
+        self._pending_rotations[index] = radians
+        if not self._drag_drain_timer.isActive():
+            self._drag_drain_timer.start()
+
+    def _apply_canvas_rotation(self, index: int, radians: float) -> bool:
+        if index < 0 or index >= len(self.path.path_elements):
+            return False
         
         elem = self.path.path_elements[index]
-        # Clamp using sidebar metadata (degrees domain), then convert back to radians
-        degrees = math.degrees(radians)
-        degrees = clamp_from_metadata('rotation_degrees', float(degrees))
-        clamped_radians = math.radians(degrees)
-        if isinstance(elem, RotationTarget):
-            elem.rotation_radians = clamped_radians
-        elif isinstance(elem, Waypoint):
-            elem.rotation_target.rotation_radians = clamped_radians
-        # Name the in-progress action for UI clarity
-        try:
-            if isinstance(elem, RotationTarget):
-                self.action_undo.setText("Undo Rotate RotationTarget")
-            elif isinstance(elem, Waypoint):
-                self.action_undo.setText("Undo Rotate Waypoint")
-        except Exception:
-            pass
-        # Update sidebar fields
-        self.sidebar.update_current_values_only()
+        # Clamp directly in radians against the precomputed sidebar metadata bounds
+        lo, hi = self._rot_bounds_rad
+        radians = float(radians)
+        clamped_radians = lo if radians < lo else (hi if radians > hi else radians)
+        handler = self._rotate_handlers.get(type(elem))
+        if handler is None or not handler(elem, clamped_radians):
+            return False
         # Debounced autosave on rotation changes
         self._schedule_autosave()
-
-        # Debounce: capture the state at start of rotation (via _on_canvas_element_pressed) and
-        # commit the undo entry when rotation drag finishes (see _on_canvas_rotation_finished).
-        if not hasattr(self, '_rotate_start_state'):
-            # First rotation change – snapshot pre-rotation state
-            self._rotate_start_state = copy.deepcopy(self.path)
+        # Undo: the pre-gesture snapshot is taken on press and committed on release
+        return True
 
     def _reproject_all_rotation_positions(self):
         # No-op under ratio-based rotation positioning. Canvas derives positions from t_ratio.
         return
 
+    def _anchor_indices(self, index: int) -> Tuple[int, int]:
+        """Return (prev, next) indices of the nearest translation/waypoint around index (-1 if none).
+
+        Two index tables are rebuilt in one sweep after structural edits; lookups are O(1).
+        """
+        if self._anchor_prev is None:
+            # Local aliases: avoid repeated global lookups inside the sweep
+            tt_type = TranslationTarget
+            wp_type = Waypoint
+            self._anchor_prev, self._anchor_next = anchor_neighbor_indices(
+                [type(e) is tt_type or type(e) is wp_type for e in self.path.path_elements])
+        if index < 0 or index >= len(self._anchor_prev):
+            return -1, -1
+        return self._anchor_prev[index], self._anchor_next[index]
+
+    def _invalidate_neighbor_cache(self):
+        self._anchor_prev = None
+        self._anchor_next = None
+
+    def _anchor_positions(self, index: int):
+        """Return ((x, y) | None, (x, y) | None) of the nearest translation/waypoint before and after index."""
+        elements = self.path.path_elements
+        prev_idx, next_idx = self._anchor_indices(index)
+        return self._anchor_xy(elements, prev_idx), self._anchor_xy(elements, next_idx)
+
+    @staticmethod
+    def _anchor_xy(elements, idx: int):
+        if idx < 0:
+            return None
+        e = elements[idx]
+        if type(e) is Waypoint:
+            e = e.translation_target
+        return (e.x_meters, e.y_meters)
+
     def _project_point_between_neighbors(self, index: int, x_m: float, y_m: float) -> Tuple[float, float]:
         # Find previous and next translation/waypoint elements
-        prev_pos = None
-        for i in range(index - 1, -1, -1):
-            e = self.path.path_elements[i]
-            if isinstance(e, (TranslationTarget, Waypoint)):
-                prev_pos = (e.x_meters, e.y_meters) if isinstance(e, TranslationTarget) else (
-                    e.translation_target.x_meters, e.translation_target.y_meters)
-                break
-        next_pos = None
-        for i in range(index + 1, len(self.path.path_elements)):
-            e = self.path.path_elements[i]
-            if isinstance(e, (TranslationTarget, Waypoint)):
-                next_pos = (e.x_meters, e.y_meters) if isinstance(e, TranslationTarget) else (
-                    e.translation_target.x_meters, e.translation_target.y_meters)
-                break
+        prev_pos, next_pos = self._anchor_positions(index)
         if prev_pos is None or next_pos is None:
             return x_m, y_m
         ax, ay = prev_pos
         bx, by = next_pos
-        dx = bx - ax
-        dy = by - ay
-        denom = dx * dx + dy * dy
-        if denom <= 0.0:
+        t = self._project_t_ratio(ax, ay, bx, by, x_m, y_m)
+        if t is None:
             return x_m, y_m
-        t = ((x_m - ax) * dx + (y_m - ay) * dy) / denom
-        if t < 0.0:
-            t = 0.0
-        elif t > 1.0:
-            t = 1.0
-        proj_x = ax + t * dx
-        proj_y = ay + t * dy
+        proj_x = ax + t * (bx - ax)
+        proj_y = ay + t * (by - ay)
         # Final clamp to field limits
-        proj_x = clamp_from_metadata('x_meters', proj_x)
-        proj_y = clamp_from_metadata('y_meters', proj_y)
+        proj_x = _X_MIN if proj_x < _X_MIN else (_X_MAX if proj_x > _X_MAX else proj_x)
+        proj_y = _Y_MIN if proj_y < _Y_MIN else (_Y_MAX if proj_y > _Y_MAX else proj_y)
         return proj_x, proj_y
 
+    @Slot(int)
     def _on_canvas_drag_finished(self, index: int):
         """Called once per item when the user releases the mouse after dragging."""
+        # Apply the final queued position before recording undo / reordering
+        self._drain_pending_drag()
+        self._end_drag_autosave()
+        start_state, self._gesture_start_state = self._gesture_start_state, None
         if getattr(self, '_layout_stabilizing', False):
             return
         if index < 0 or index >= len(self.path.path_elements):
             return
         
         # Record the drag operation for undo/redo
-        if hasattr(self, '_drag_start_state'):
+        if start_state is not None:
             element_type = type(self.path.path_elements[index]).__name__
-            self._record_path_change(f"Move {element_type}", self._drag_start_state)
-            delattr(self, '_drag_start_state')
+            self._record_path_change(f"Move {element_type}", self._gesture_old_path(start_state),
+                                     owned=isinstance(start_state, Path), index=index)
         
         # Remember which element was dragged so we can re-select it after any reordering
         dragged_elem = self.path.path_elements[index]
 
         # Re-evaluate rotation order now that the drag is complete
-        self.sidebar._check_and_swap_rotation_targets()
-
-        # Attempt to restore selection for the dragged element
-        try:
-            new_index = self.path.path_elements.index(dragged_elem)
-        except ValueError:
-            new_index = -1
+        new_index = index
+        if self.sidebar._check_and_swap_rotation_targets():
+            # Find the dragged element again by identity (list.index would compare dataclass values)
+            new_index = next((i for i, e in enumerate(self.path.path_elements) if e is dragged_elem), -1)
         if new_index >= 0:
             self.sidebar.select_index(new_index)
+        # Drag is over: commit its undo entry (including any reordering) right away
+        self._flush_pending_undo()
 
     def _on_canvas_rotation_finished(self, index: int):
         """Record rotation change undo when the user releases the rotation handle."""
+        self._drain_pending_drag()
+        self._end_drag_autosave()
+        start_state, self._gesture_start_state = self._gesture_start_state, None
         if getattr(self, '_layout_stabilizing', False):
             return
-        if not hasattr(self, '_rotate_start_state'):
+        if start_state is None or index < 0 or index >= len(self.path.path_elements):
             return
-        try:
-            elem = self.path.path_elements[index]
-            if isinstance(elem, RotationTarget):
-                self._record_path_change("Rotate RotationTarget", self._rotate_start_state)
-            elif isinstance(elem, Waypoint):
-                self._record_path_change("Rotate Waypoint", self._rotate_start_state)
-        finally:
-            if hasattr(self, '_rotate_start_state'):
-                delattr(self, '_rotate_start_state')
+        label = _ROTATE_LABELS.get(type(self.path.path_elements[index]))
+        if label is not None:
+            self._record_path_change(label, self._gesture_old_path(start_state), owned=isinstance(start_state, Path),
+                                     index=index)
+            self._flush_pending_undo()
 
     # ---------------- Autosave ----------------
+    def _end_drag_autosave(self):
+        self._drag_active = False
+        # A press that moved nothing (plain click) has nothing to save
+        if self._model_epoch != self._saved_epoch:
+            self._start_autosave_timer()
+
+    @Slot()
     def _schedule_autosave(self):
+        self._model_epoch += 1
+        # A drag in progress autosaves once on release instead of restarting the timer per sample
+        if self._drag_active:
+            return
+        self._start_autosave_timer()
+
+    def _start_autosave_timer(self):
         # Coalesce frequent updates
         self._autosave_timer.start()
         # Show autosave indicator
         self._show_autosave_indicator()
 
+    @Slot()
     def _do_autosave(self):
         # Ensure project dir exists before saving
         if not self.project_manager.has_valid_project():
@@ -1419,23 +1712,80 @@ class MainWindow(QMainWindow):
             self._show_autosave_feedback("Autosave skipped: No valid project", error=True)
             return
 
+        # One write in flight at a time; edits made meanwhile are saved once it lands
+        if self._autosave_task is not None:
+            self._autosave_rerun = True
+            return
+        # Nothing edited since the last save or load
+        if self._model_epoch == self._saved_epoch:
+            self._hide_autosave_indicator()
+            return
+
         try:
-            result = self.project_manager.save_path(self.path)
-            if result is not None:
-                # Autosave successful
-                self._hide_autosave_indicator()
-                self._show_autosave_feedback("Autosaved successfully", error=False)
+            self._autosave_epoch = self._model_epoch
+            # Encode on the UI thread straight from the live model; the bytes are the snapshot
+            pm = self.project_manager
+            job = pm.prepare_path_save(pm.encode_path(self.path))
+            if job is None:
+                self._on_autosave_written(None, "Could not save path")
+            elif not job.needs_write:
+                self._on_autosave_written(job, "")
             else:
-                # Autosave failed
-                self._hide_autosave_indicator()
-                self._show_autosave_feedback("Autosave failed: Could not save path", error=True)
+                task = PathWriteTask(job)
+                task.signals.finished.connect(self._on_autosave_task_finished)
+                self._autosave_task = task
+                self._path_write_pool.start(task)
         except Exception as e:
             # Autosave failed with exception
             self._hide_autosave_indicator()
             self._show_autosave_feedback(f"Autosave failed: {str(e)}", error=True)
 
+    def _wait_for_autosave_write(self):
+        """Block until an in-flight autosave write lands, before path files are touched directly."""
+        task = self._autosave_task
+        if task is None:
+            return
+        self._path_write_pool.waitForDone()
+        # The queued finished signal would only be handled after the caller has deleted or renamed
+        # files, so finish the save here
+        try:
+            task.signals.finished.disconnect(self._on_autosave_task_finished)
+        except Exception:
+            pass
+        self._on_autosave_written(task.job, task.error or "")
+
+    @Slot(object, str)
+    def _on_autosave_task_finished(self, job: PathSaveJob, error: str):
+        # Ignore a delivery for a task _wait_for_autosave_write has already finished
+        task = self._autosave_task
+        if task is None or task.job is not job:
+            return
+        self._on_autosave_written(job, error)
+
+    @Slot(object, str)
+    def _on_autosave_written(self, job: PathSaveJob, error: str):
+        """Finish an autosave on the UI thread (from the writer task, or directly for skipped writes)."""
+        self._autosave_task = None
+        self._hide_autosave_indicator()
+        if job is not None and not error:
+            self.project_manager.finish_path_save(job, make_current=False)
+            self._saved_epoch = max(self._saved_epoch, self._autosave_epoch)
+            # Autosave successful
+            self._show_autosave_feedback("Autosaved successfully", error=False)
+        else:
+            # Autosave failed
+            self._show_autosave_feedback(f"Autosave failed: {error or 'Could not save path'}", error=True)
+        if self._autosave_rerun:
+            self._autosave_rerun = False
+            self._start_autosave_timer()
+
     def _show_autosave_indicator(self):
         """Show the autosave status indicator and update status widget."""
+        # Already showing: every edit in a burst reschedules autosave, but the widgets only need
+        # styling once (setStyleSheet re-parses and re-polishes)
+        if self._autosave_indicator_shown:
+            return
+        self._autosave_indicator_shown = True
         # Update status bar indicator
         self.autosave_indicator.setVisible(True)
         self.autosave_indicator.setStyleSheet("color: #d4a76a; font-size: 12px; margin-left: 5px;")
@@ -1472,6 +1822,7 @@ class MainWindow(QMainWindow):
             message: The feedback message to display
             error: True if this is an error message, False for success
         """
+        self._autosave_indicator_shown = False
         if error:
             # Show error state
             self.autosave_status_widget.setText("❌ Error")
@@ -1511,6 +1862,7 @@ class MainWindow(QMainWindow):
 
     def _reset_autosave_status(self):
         """Reset the autosave status widget to saved state."""
+        self._autosave_indicator_shown = False
         self.autosave_status_widget.setText("Saved")
         self.autosave_status_widget.setStyleSheet("""
             QLabel {
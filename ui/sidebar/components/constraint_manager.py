@@ -1114,52 +1114,33 @@ class ConstraintManager(QObject):
         except Exception:
             pass
             
+    def _range_widget_ids(self) -> set:
+        """Return ids of every range-related slider, slider row and spinbox currently tracked."""
+        ids = set()
+        for slider_list in self._range_sliders.values():
+            ids.update(id(w) for w in slider_list or [] if w is not None)
+        ids.update(id(row) for row in self._range_slider_rows.values() if row is not None)
+        for spin_list in self._range_spinboxes.values():
+            ids.update(id(w) for w in spin_list or [] if w is not None)
+        return ids
+
     def is_widget_range_related(self, widget: QWidget) -> bool:
         """Return True if the clicked widget is inside a constraint label/spinner/slider area."""
         try:
             if widget is None:
                 return False
-                
-            # Check sliders
-            for _key, slider_list in self._range_sliders.items():
-                for slider in slider_list:
-                    try:
-                        if slider is widget:
-                            return True
-                        if hasattr(slider, 'isAncestorOf') and slider.isAncestorOf(widget):
-                            return True
-                    except Exception:
-                        pass
-                    
-            # Check slider containers
-            for _key, row in self._range_slider_rows.items():
-                if row is None:
-                    continue
-                try:
-                    if row is widget:
-                        return True
-                    if hasattr(row, 'isAncestorOf') and row.isAncestorOf(widget):
-                        return True
-                except Exception:
-                    pass
-            
-            # Check spinboxes and their child widgets
-            try:
-                for _key, spin_list in self._range_spinboxes.items():
-                    for spin in spin_list or []:
-                        try:
-                            if spin is widget:
-                                return True
-                            if hasattr(spin, 'isAncestorOf') and spin.isAncestorOf(widget):
-                                return True
-                        except Exception:
-                            continue
-            except Exception:
-                pass
-                    
+            ids = self._range_widget_ids()
+            if not ids:
+                return False
+            # One walk up the clicked widget's parents with set lookups, instead of an
+            # isAncestorOf() call per tracked control
+            curr = widget
+            while curr is not None:
+                if id(curr) in ids:
+                    return True
+                curr = curr.parentWidget()
         except Exception:
             return False
-            
         return False
 
     def can_add_more_instances(self, key: str) -> bool:
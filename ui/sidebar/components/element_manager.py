@@ -5,7 +5,7 @@ from typing import List, Tuple, Optional, Any
 from PySide6.QtCore import QObject, Signal
 from models.path_model import Path, TranslationTarget, RotationTarget, Waypoint
 from ui.canvas import FIELD_LENGTH_METERS, FIELD_WIDTH_METERS, ELEMENT_RECT_WIDTH_M, ELEMENT_RECT_HEIGHT_M
-from ..utils import ElementType, get_element_position, get_neighbor_positions, get_element_bounding_radius, clamp_from_metadata, get_safe_position_for_rotation
+from ..utils import ElementType, get_element_position, get_neighbor_positions, get_element_bounding_radius, clamp_xy, get_safe_position_for_rotation
 
 
 class ElementManager(QObject):
@@ -81,24 +81,22 @@ class ElementManager(QObject):
         """Find a nearby position to base_x/base_y that avoids significant overlap with existing elements."""
         if self.path is None or not getattr(self.path, 'path_elements', None):
             # Clamp to field bounds and return
-            return (
-                clamp_from_metadata('x_meters', float(base_x)),
-                clamp_from_metadata('y_meters', float(base_y)),
-            )
+            return clamp_xy(float(base_x), float(base_y))
+
+        # Robot dimensions are the same for every element; read them once
+        length_m, width_m = self.get_robot_dimensions()
 
         # Build list of existing positions and their radii
         existing: List[Tuple[float, float, float]] = []
         try:
             for i, el in enumerate(self.path.path_elements):
                 px, py = get_element_position(el, i, self.path.path_elements)
-                length_m, width_m = self.get_robot_dimensions()
                 r = get_element_bounding_radius(el, length_m, width_m)
                 existing.append((float(px), float(py), float(r)))
         except Exception:
             pass
 
         # Get radius for new element type
-        length_m, width_m = self.get_robot_dimensions()
         if new_type == ElementType.TRANSLATION:
             from ui.canvas import ELEMENT_CIRCLE_RADIUS_M
             new_r = float(ELEMENT_CIRCLE_RADIUS_M)
@@ -106,18 +104,19 @@ class ElementManager(QObject):
             new_r = float(math.hypot(length_m / 2.0, width_m / 2.0))
             
         margin = 0.10  # small visual gap
+        # Squared clearance per existing element, computed once for all candidate positions
+        obstacles = [(ox, oy, (new_r + orad + margin) ** 2) for (ox, oy, orad) in existing]
 
         def _is_clear(x: float, y: float) -> bool:
-            for (ox, oy, orad) in existing:
+            for (ox, oy, min_d2) in obstacles:
                 dx = x - ox
                 dy = y - oy
-                if dx * dx + dy * dy < (new_r + orad + margin) ** 2:
+                if dx * dx + dy * dy < min_d2:
                     return False
             return True
 
         # First try base
-        bx = clamp_from_metadata('x_meters', float(base_x))
-        by = clamp_from_metadata('y_meters', float(base_y))
+        bx, by = clamp_xy(float(base_x), float(base_y))
         if _is_clear(bx, by):
             return bx, by
 
@@ -132,8 +131,7 @@ class ElementManager(QObject):
         for ring in range(1, 4):
             dist = step * ring
             for dx_unit, dy_unit in directions:
-                x = clamp_from_metadata('x_meters', bx + dx_unit * dist)
-                y = clamp_from_metadata('y_meters', by + dy_unit * dist)
+                x, y = clamp_xy(bx + dx_unit * dist, by + dy_unit * dist)
                 if _is_clear(x, y):
                     return x, y
 
@@ -306,51 +304,26 @@ class ElementManager(QObject):
             return
 
         elems = self.path.path_elements
+        anchor_types = (TranslationTarget, Waypoint)
 
-        # Collect indices of anchor elements
-        anchor_indices = [i for i, e in enumerate(elems) if isinstance(e, (TranslationTarget, Waypoint))]
-        if len(anchor_indices) < 2:
-            return
-
-        changed = False
-
-        # Iterate over each consecutive anchor pair
-        for seg_idx in range(len(anchor_indices) - 1):
-            start_idx = anchor_indices[seg_idx]
-            end_idx = anchor_indices[seg_idx + 1]
-
-            # Gather rotation elements between anchors
-            between_indices = [j for j in range(start_idx + 1, end_idx) if isinstance(elems[j], RotationTarget)]
-            if len(between_indices) < 2:
-                continue
-
-            # Desired order based on t_ratio
-            try:
-                desired_order = sorted(between_indices, key=lambda j: float(getattr(elems[j], 't_ratio', 0.0)))
-            except Exception:
-                desired_order = between_indices[:]
-
-            if between_indices == desired_order:
+        # Single pass: the rotation targets between two consecutive anchors form a contiguous run
+        run_start = -1
+        for i, e in enumerate(elems):
+            if not isinstance(e, anchor_types):
                 continue
+            if run_start >= 0 and i - run_start >= 2:
+                run = elems[run_start:i]
+                # Desired order based on t_ratio (stable, so ties keep their order)
+                try:
+                    desired = sorted(run, key=lambda r: float(getattr(r, 't_ratio', 0.0)))
+                except Exception:
+                    desired = run
+                if any(a is not b for a, b in zip(desired, run)):
+                    elems[run_start:i] = desired
+                    return True
+            run_start = i + 1
 
-            changed = True
-
-            # Extract the rotation elements in desired order
-            desired_elements = [elems[idx] for idx in desired_order]
-
-            # Remove all rotation elements between anchors
-            for j in reversed(between_indices):
-                elems.pop(j)
-
-            # Re-insert in correct order
-            insert_at = start_idx + 1
-            for el in desired_elements:
-                elems.insert(insert_at, el)
-                insert_at += 1
-
-            break
-
-        return changed
+        return False
         
     def _get_default_position_for_new_element(self, current_selection_idx: Optional[int]) -> Tuple[float, float]:
         """Get default position for a new element based on current selection."""
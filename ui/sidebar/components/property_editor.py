@@ -357,12 +357,21 @@ class PropertyEditor(QObject):
             control, _, _, _ = self.spinners[name]
             if not control.isVisible():
                 return
+            # Skip controls already showing this value (sub-step drag motion, repeated refreshes)
+            if isinstance(control, QCheckBox):
+                value = bool(value)
+                if control.isChecked() == value:
+                    return
+            else:
+                value = float(value)
+                if round(value, control.decimals()) == control.value():
+                    return
             try:
                 control.blockSignals(True)
                 if isinstance(control, QCheckBox):
-                    control.setChecked(bool(value))
+                    control.setChecked(value)
                 else:
-                    control.setValue(float(value))
+                    control.setValue(value)
             finally:
                 control.blockSignals(False)
 
@@ -4,12 +4,15 @@ from typing import Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel, QComboBox,
     QGroupBox, QSizePolicy, QSpacerItem, QListWidgetItem, QPushButton,
-    QScrollArea
+    QScrollArea, QApplication
 )
 from PySide6.QtCore import Qt, Signal, QTimer, QEvent, QSize
 from PySide6.QtGui import QIcon
 from models.path_model import Path, TranslationTarget, RotationTarget, Waypoint
 
+# Event types the constraint-preview filter reacts to; everything else returns immediately
+_PRESS_EVENT_TYPES = frozenset((QEvent.MouseButtonPress, QEvent.MouseButtonDblClick))
+
 
 class PersistentScrollArea(QScrollArea):
     """A QScrollArea that automatically remembers and restores its scroll position."""
@@ -25,7 +28,6 @@ class PersistentScrollArea(QScrollArea):
         """Remember the scroll position when it changes."""
         if not self._suppress_scroll_events:
             self._last_scroll_value = value
-            # print(f"PersistentScrollArea: Scroll position changed to {value}")
 
     def set_scroll_preserved_widget(self, widget):
         """Set the widget and preserve scroll position."""
@@ -38,7 +40,6 @@ class PersistentScrollArea(QScrollArea):
         """Start preserving scroll position during bulk operations."""
         self._preserve_scroll = True
         self._last_scroll_value = self.verticalScrollBar().value()
-        # print(f"PersistentScrollArea: Beginning scroll preservation at {self._last_scroll_value}")
 
     def end_scroll_preservation(self):
         """End scroll preservation and restore position."""
@@ -50,7 +51,6 @@ class PersistentScrollArea(QScrollArea):
         if hasattr(self, '_last_scroll_value'):
             current_value = self.verticalScrollBar().value()
             if current_value != self._last_scroll_value:
-                # print(f"PersistentScrollArea: Restoring scroll from {current_value} to {self._last_scroll_value}")
                 self._suppress_scroll_events = True
                 self.verticalScrollBar().setValue(self._last_scroll_value)
                 self._suppress_scroll_events = False
@@ -64,7 +64,6 @@ class PersistentScrollArea(QScrollArea):
         if hasattr(self, '_last_scroll_value') and not self._preserve_scroll:
             current_value = self.verticalScrollBar().value()
             if current_value != self._last_scroll_value:
-                # print(f"PersistentScrollArea: Force restoring scroll from {current_value} to {self._last_scroll_value}")
                 self.verticalScrollBar().setValue(self._last_scroll_value)
 
 from .widgets import CustomList, PersistentCustomList, PopupCombobox
@@ -166,8 +165,20 @@ class Sidebar(QWidget):
         
     # No stretch at bottom so last expanding sections (properties / constraints) fill space
         
-        # Install event filter for constraint preview handling
+        # Install event filters for constraint preview handling: the sidebar itself and the
+        # elements list viewport (clicks there never reach the sidebar)
         self.installEventFilter(self)
+        try:
+            self.points_list.viewport().installEventFilter(self)
+        except Exception:
+            pass
+        # Focus moving to any non-range control (spinners, combos, other windows' widgets) clears the overlay
+        try:
+            app = QApplication.instance()
+            if app is not None:
+                app.focusChanged.connect(self._on_app_focus_changed)
+        except Exception:
+            pass
         
     def _create_path_elements_bar(self, parent_layout):
         """Create the Path Elements title bar with add button."""
@@ -478,6 +489,17 @@ class Sidebar(QWidget):
             return None
         return row
         
+    def remove_selected_element(self) -> bool:
+        """Remove the selected element (undo is announced via aboutToChange/userActionOccurred).
+
+        Returns False when nothing is selected.
+        """
+        idx = self.get_selected_index()
+        if idx is None:
+            return False
+        self._on_remove_element(idx)
+        return True
+
     def select_index(self, index: int):
         """Select an element by index."""
         if index is None:
@@ -525,9 +547,10 @@ class Sidebar(QWidget):
         """
         try:
             if hasattr(self, 'element_manager') and self.element_manager is not None:
-                self.element_manager.check_and_swap_rotation_targets()
+                return bool(self.element_manager.check_and_swap_rotation_targets())
         except Exception:
             pass
+        return False
         
     def refresh_current_selection(self):
         """Re-run expose for current selection using current model values."""
@@ -1126,40 +1149,47 @@ class Sidebar(QWidget):
             
     def eventFilter(self, obj, event):
         """Handle events for constraint preview management."""
+        # Hot path: the list viewport sees every paint/hover/move event
+        if event.type() not in _PRESS_EVENT_TYPES:
+            return False
         try:
-            et = event.type()
-            
-            # Handle clicks/double-clicks to manage constraint preview
-            if et in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick):
-                # If click is on the sidebar itself, determine the child under the cursor
+            # If click is on the sidebar itself, determine the child under the cursor
+            target_widget = obj
+            try:
+                if obj is self:
+                    ev = event
+                    pos = getattr(ev, 'position', None)
+                    if pos is not None:
+                        pt = pos().toPoint() if callable(pos) else pos.toPoint()
+                    else:
+                        pt = getattr(ev, 'pos', lambda: None)()
+                    if pt is not None:
+                        child = self.childAt(pt)
+                        if child is not None:
+                            target_widget = child
+            except Exception:
                 target_widget = obj
-                try:
-                    if obj is self:
-                        ev = event
-                        pos = getattr(ev, 'position', None)
-                        if pos is not None:
-                            pt = pos().toPoint() if callable(pos) else pos.toPoint()
-                        else:
-                            pt = getattr(ev, 'pos', lambda: None)()
-                        if pt is not None:
-                            child = self.childAt(pt)
-                            if child is not None:
-                                target_widget = child
-                except Exception:
-                    target_widget = obj
 
-                # Check if clicking on any range-related control
-                if self.constraint_manager.is_widget_range_related(target_widget):
-                    return False
-                
-                # Clicked somewhere else → clear overlay
-                self.constraint_manager.clear_active_preview()
+            # Check if clicking on any range-related control
+            if self.constraint_manager.is_widget_range_related(target_widget):
                 return False
-                        
+            
+            # Clicked somewhere else → clear overlay
+            self.constraint_manager.clear_active_preview()
+            return False
         except Exception:
             pass
         return super().eventFilter(obj, event)
         
+    def _on_app_focus_changed(self, _old, new):
+        if new is None:
+            return
+        try:
+            if not self.constraint_manager.is_widget_range_related(new):
+                self.constraint_manager.clear_active_preview()
+        except Exception:
+            pass
+
     # ---- Public helpers for external widgets to control constraint preview ----
     def clear_active_preview(self):
         """Clear active constraint preview."""
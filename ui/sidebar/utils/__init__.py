@@ -1,6 +1,7 @@
 from .constants import ElementType, SPINNER_METADATA, DEGREES_TO_RADIANS_ATTR_MAP, PATH_CONSTRAINT_KEYS, NON_RANGED_CONSTRAINT_KEYS
 from .element_helpers import (
     clamp_from_metadata,
+    clamp_xy,
     get_element_position,
     get_neighbor_positions,
     get_element_bounding_radius,
@@ -15,6 +16,7 @@ __all__ = [
     'PATH_CONSTRAINT_KEYS',
     'NON_RANGED_CONSTRAINT_KEYS',
     'clamp_from_metadata',
+    'clamp_xy',
     'get_element_position',
     'get_neighbor_positions',
     'get_element_bounding_radius',
@@ -30,6 +30,15 @@ def clamp_from_metadata(key: str, value: float) -> float:
     return value
 
 
+def clamp_xy(x: float, y: float) -> Tuple[float, float]:
+    """Clamp a model-space point to the 'x_meters'/'y_meters' metadata ranges in one call."""
+    x_min, x_max = SPINNER_METADATA['x_meters']['range']
+    y_min, y_max = SPINNER_METADATA['y_meters']['range']
+    x = x_min if x < x_min else (x_max if x > x_max else x)
+    y = y_min if y < y_min else (y_max if y > y_max else y)
+    return x, y
+
+
 def get_element_position(element: Any, idx: int, path_elements: List[Any]) -> Tuple[float, float]:
     """Return model-space center position for an element."""
     if isinstance(element, (TranslationTarget, Waypoint)):
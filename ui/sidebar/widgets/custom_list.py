@@ -27,13 +27,11 @@ class PersistentCustomList(QListWidget):
         """Remember the scroll position when it changes."""
         if not self._suppress_scroll_events and not self._auto_scroll_disabled:
             self._last_scroll_value = value
-            # print(f"PersistentCustomList: Scroll position changed to {value}")
 
     def begin_scroll_preservation(self):
         """Start preserving scroll position during bulk operations."""
         self._preserve_scroll = True
         self._last_scroll_value = self.verticalScrollBar().value()
-        # print(f"PersistentCustomList: Beginning scroll preservation at {self._last_scroll_value}")
 
     def end_scroll_preservation(self):
         """End scroll preservation and restore position."""
@@ -45,7 +43,6 @@ class PersistentCustomList(QListWidget):
         if hasattr(self, '_last_scroll_value'):
             current_value = self.verticalScrollBar().value()
             if current_value != self._last_scroll_value:
-                # print(f"PersistentCustomList: Restoring scroll from {current_value} to {self._last_scroll_value}")
                 self._suppress_scroll_events = True
                 self.verticalScrollBar().setValue(self._last_scroll_value)
                 self._suppress_scroll_events = False
@@ -59,7 +56,6 @@ class PersistentCustomList(QListWidget):
         if hasattr(self, '_last_scroll_value') and not self._preserve_scroll:
             current_value = self.verticalScrollBar().value()
             if current_value != self._last_scroll_value:
-                # print(f"PersistentCustomList: Force restoring scroll from {current_value} to {self._last_scroll_value}")
                 self.verticalScrollBar().setValue(self._last_scroll_value)
 
     def setCurrentRow(self, row):
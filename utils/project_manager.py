@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
-from dataclasses import asdict, is_dataclass
+from dataclasses import asdict, dataclass, is_dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import QSettings
+from PySide6.QtCore import QObject, QRunnable, QSettings, Signal
 
 from models.path_model import Path, PathElement, RotationTarget, TranslationTarget, Waypoint, RangedConstraint
 
+try:  # Optional: faster JSON parsing for path files
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+try:  # Optional: faster non-cryptographic digest for save-skip checks
+    import xxhash as _xxhash
+except ImportError:
+    _xxhash = None
+
 
 DEFAULT_CONFIG: Dict[str, float] = {
     "robot_length_meters": 0.5,
@@ -20,7 +31,9 @@ DEFAULT_CONFIG: Dict[str, float] = {
     "default_max_velocity_deg_per_sec": 720.0,
     "default_max_acceleration_deg_per_sec2": 1500.0,
     "default_end_translation_tolerance_meters": 0.03,
-    "default_end_rotation_tolerance_deg": 2.0
+    "default_end_rotation_tolerance_deg": 2.0,
+    # Editor: debounce before writing the open path to disk
+    "autosave_debounce_ms": 1000.0
 }
 
 EXAMPLE_CONFIG: Dict[str, float] = {
@@ -32,7 +45,9 @@ EXAMPLE_CONFIG: Dict[str, float] = {
     "default_max_velocity_deg_per_sec": 720.0,
     "default_max_acceleration_deg_per_sec2": 1500.0,
     "default_end_translation_tolerance_meters": 0.03,
-    "default_end_rotation_tolerance_deg": 2.0
+    "default_end_rotation_tolerance_deg": 2.0,
+    # Editor: debounce before writing the open path to disk
+    "autosave_debounce_ms": 1000.0
 }
 
 
@@ -40,6 +55,73 @@ def _ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _content_digest(payload: bytes) -> bytes:
+    """8-byte digest of path file bytes, only compared against our own earlier digests."""
+    if _xxhash is not None:
+        return _xxhash.xxh3_64_digest(payload)
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+def _json_loads(raw: bytes) -> Any:
+    if _orjson is not None:
+        try:
+            return _orjson.loads(raw)
+        except ValueError:
+            # orjson is stricter (e.g. NaN/Infinity literals); let the stdlib decide
+            pass
+    return json.loads(raw)
+
+
+def _write_atomic(filepath: str, payload: bytes) -> None:
+    # Write beside the target and swap it in, so readers never see a half-written file
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, filepath)
+
+
+@dataclass
+class PathSaveJob:
+    """A path save resolved on the UI thread; only the file write may happen elsewhere."""
+    filename: str
+    filepath: str
+    payload: bytes
+    digest: bytes
+    needs_write: bool
+    creates_file: bool = False
+
+
+class _PathWriteSignals(QObject):
+    finished = Signal(object, str)  # (PathSaveJob, error message or "")
+
+
+class PathWriteTask(QRunnable):
+    """Writes a PathSaveJob's bytes on a thread pool worker and reports back via signals.finished."""
+
+    def __init__(self, job: PathSaveJob):
+        super().__init__()
+        self.job = job
+        self.signals = _PathWriteSignals()
+        # Set once run() is done ("" on success), for callers that wait instead of using the signal
+        self.error: Optional[str] = None
+
+    def run(self):
+        try:
+            _write_atomic(self.job.filepath, self.job.payload)
+            error = ""
+        except Exception as e:
+            error = str(e) or "write failed"
+        self.error = error
+        self.signals.finished.emit(self.job, error)
+
+
 class ProjectManager:
     """Handles project directory, config.json, and path JSON load/save.
 
@@ -57,6 +139,13 @@ class ProjectManager:
         self.project_dir: Optional[str] = None
         self.config: Dict[str, Any] = DEFAULT_CONFIG.copy()
         self.current_path_file: Optional[str] = None  # filename like "example.json"
+        # filepath -> (content digest, mtime_ns) of our last write, to skip identical autosaves
+        self._last_saved: Dict[str, Tuple[bytes, Optional[int]]] = {}
+        # (paths dir, dir mtime_ns, sorted .json names) from the last directory listing
+        self._paths_listing: Optional[Tuple[str, Optional[int], Tuple[str, ...]]] = None
+        # Bumped whenever this process adds, removes or renames path files; directory mtimes alone
+        # miss changes within one timestamp tick on coarse filesystems (FAT/exFAT, some shares)
+        self.paths_generation = 0
 
     # --------------- Project directory ---------------
     def set_project_dir(self, directory: str) -> None:
@@ -192,12 +281,23 @@ class ProjectManager:
             return None
 
     # --------------- Paths listing ---------------
+    def invalidate_paths_listing(self) -> None:
+        """Forget the cached directory listing after path files were created, deleted or renamed."""
+        self._paths_listing = None
+        self.paths_generation += 1
+
     def list_paths(self) -> List[str]:
         paths_dir = self.get_paths_dir()
         if not paths_dir or not os.path.isdir(paths_dir):
             return []
+        # Adding, removing or renaming a file bumps the directory mtime; otherwise reuse the last listing
+        mtime = _mtime_ns(paths_dir)
+        cached = self._paths_listing
+        if mtime is not None and cached is not None and cached[0] == paths_dir and cached[1] == mtime:
+            return list(cached[2])
         files = [f for f in os.listdir(paths_dir) if f.lower().endswith(".json")]
         files.sort()
+        self._paths_listing = (paths_dir, mtime, tuple(files))
         return files
 
     # --------------- Path IO ---------------
@@ -210,9 +310,13 @@ class ProjectManager:
         if not os.path.isfile(filepath):
             return None
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                raw = f.read()
+            data = _json_loads(raw)
             path = self._deserialize_path(data)
+            # Hash the bytes already in hand: if this app wrote the file, the first autosave after
+            # loading encodes the same bytes and skips the rewrite
+            self._last_saved[filepath] = (_content_digest(raw), _mtime_ns(filepath))
             self.current_path_file = filename
             # Remember in settings
             self.settings.setValue(self.KEY_LAST_PATH_FILE, filename)
@@ -224,6 +328,37 @@ class ProjectManager:
         """Save path to filename in the paths dir. If filename is None, uses current_path_file
         or creates 'untitled.json'. Returns the filename used on success.
         """
+        try:
+            payload = self.encode_path(path)
+        except Exception:
+            return None
+        return self.save_path_bytes(payload, filename)
+
+    def encode_path(self, path: Path) -> bytes:
+        """Serialize a path to the JSON file bytes written by save_path.
+
+        Reads the live model directly; no copy is needed because the result is plain bytes.
+        """
+        return json.dumps(self._serialize_path(path), indent=2).encode("utf-8")
+
+    def save_path_bytes(self, payload: bytes, filename: Optional[str] = None) -> Optional[str]:
+        """Write already-encoded path bytes (see encode_path). Same filename rules and result as save_path."""
+        job = self.prepare_path_save(payload, filename)
+        if job is None:
+            return None
+        try:
+            if job.needs_write:
+                _write_atomic(job.filepath, job.payload)
+        except Exception:
+            return None
+        return self.finish_path_save(job)
+
+    def prepare_path_save(self, payload: bytes, filename: Optional[str] = None) -> Optional[PathSaveJob]:
+        """Resolve where encoded path bytes go and whether the write can be skipped.
+
+        Returns None without a valid project. Run PathWriteTask for jobs that need a write,
+        then finish_path_save on the UI thread.
+        """
         if filename is None:
             filename = self.current_path_file
         if filename is None:
@@ -231,35 +366,62 @@ class ProjectManager:
         paths_dir = self.get_paths_dir()
         if not self.project_dir or not paths_dir:
             return None
-        _ensure_dir(paths_dir)
-        filepath = os.path.join(paths_dir, filename)
         try:
-            serialized = self._serialize_path(path)
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(serialized, f, indent=2)
-            self.current_path_file = filename
-            self.settings.setValue(self.KEY_LAST_PATH_FILE, filename)
-            return filename
-        except Exception:
+            _ensure_dir(paths_dir)
+        except OSError:
             return None
+        filepath = os.path.join(paths_dir, filename)
+        digest = _content_digest(payload)
+        # Skip the write when we last wrote these exact bytes and the file is untouched since
+        last = self._last_saved.get(filepath)
+        mtime = _mtime_ns(filepath)
+        needs_write = last is None or last[0] != digest or last[1] != mtime
+        return PathSaveJob(filename, filepath, payload, digest, needs_write, mtime is None)
+
+    def finish_path_save(self, job: PathSaveJob, make_current: bool = True) -> str:
+        """Record a completed save (UI thread). Returns the filename used.
+
+        Background writes pass make_current=False: another path may have been opened while the
+        write ran, and the editor must not switch back to the saved file.
+        """
+        if job.needs_write:
+            self._last_saved[job.filepath] = (job.digest, _mtime_ns(job.filepath))
+            if job.creates_file:
+                self.invalidate_paths_listing()
+        if make_current or self.current_path_file is None or self.current_path_file == job.filename:
+            self.current_path_file = job.filename
+            self.settings.setValue(self.KEY_LAST_PATH_FILE, job.filename)
+        return job.filename
 
     def delete_path(self, filename: str) -> bool:
         """Delete a path file from the paths directory. Returns True if successful."""
+        return self.delete_paths([filename]) == 1
+
+    def delete_paths(self, filenames: List[str]) -> int:
+        """Delete several path files from the paths directory. Returns how many were deleted."""
         paths_dir = self.get_paths_dir()
         if not self.project_dir or not paths_dir:
-            return False
-        filepath = os.path.join(paths_dir, filename)
-        if not os.path.isfile(filepath):
-            return False
-        try:
-            os.remove(filepath)
-            # If this was the current path, clear it
+            return 0
+        deleted = 0
+        current_deleted = False
+        for filename in filenames:
+            filepath = os.path.join(paths_dir, filename)
+            try:
+                # unlink reports a missing file itself; no separate isfile stat per name
+                os.remove(filepath)
+            except OSError:
+                continue
+            self._last_saved.pop(filepath, None)
+            deleted += 1
             if self.current_path_file == filename:
-                self.current_path_file = None
-                self.settings.remove(self.KEY_LAST_PATH_FILE)
-            return True
-        except Exception:
-            return False
+                current_deleted = True
+        if deleted:
+            self.invalidate_paths_listing()
+        # If the current path was among them, clear it (one settings write for the batch)
+        if current_deleted:
+            self.current_path_file = None
+            self.settings.remove(self.KEY_LAST_PATH_FILE)
+        return deleted
 
     def load_last_or_first_or_create(self) -> Tuple[Path, str]:
         """Attempt to load last path (from settings). If unavailable, load first available
@@ -701,32 +863,32 @@ class ProjectManager:
         except Exception:
             pass
         # Two example paths
-        try:
-            path1 = Path()
-            path1.path_elements.extend([
-                TranslationTarget(x_meters=2.0, y_meters=2.0),
-                RotationTarget(rotation_radians=0.0, t_ratio=0.5, profiled_rotation=True),
-                Waypoint(
-                    translation_target=TranslationTarget(x_meters=6.0, y_meters=4.0),
-                    rotation_target=RotationTarget(rotation_radians=0.5, t_ratio=0.0, profiled_rotation=True),
-                ),
-                TranslationTarget(x_meters=10.0, y_meters=6.0),
-            ])
-            with open(os.path.join(paths_dir, "example_a.json"), "w", encoding="utf-8") as f:
-                json.dump(self._serialize_path(path1), f, indent=2)
-        except Exception:
-            pass
-        try:
-            path2 = Path()
-            path2.path_elements.extend([
-                TranslationTarget(x_meters=1.0, y_meters=7.5),
-                TranslationTarget(x_meters=5.0, y_meters=6.0),
-                RotationTarget(rotation_radians=1.2, t_ratio=0.5, profiled_rotation=True),
-                TranslationTarget(x_meters=12.5, y_meters=3.0),
-            ])
-            with open(os.path.join(paths_dir, "example_b.json"), "w", encoding="utf-8") as f:
-                json.dump(self._serialize_path(path2), f, indent=2)
-        except Exception:
-            pass
+        for fname, path in self._make_example_paths():
+            try:
+                with open(os.path.join(paths_dir, fname), "w", encoding="utf-8") as f:
+                    json.dump(self._serialize_path(path), f, indent=2)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _make_example_paths() -> List[Tuple[str, Path]]:
+        """Build the example paths written into a freshly created project."""
+        # Positional args: TranslationTarget(x, y), RotationTarget(radians, t_ratio, profiled)
+        TT, RT, WP = TranslationTarget, RotationTarget, Waypoint
+        path1 = Path()
+        path1.path_elements.extend((
+            TT(2.0, 2.0),
+            RT(0.0, 0.5, True),
+            WP(TT(6.0, 4.0), RT(0.5, 0.0, True)),
+            TT(10.0, 6.0),
+        ))
+        path2 = Path()
+        path2.path_elements.extend((
+            TT(1.0, 7.5),
+            TT(5.0, 6.0),
+            RT(1.2, 0.5, True),
+            TT(12.5, 3.0),
+        ))
+        return [("example_a.json", path1), ("example_b.json", path2)]
 
 
@@ -6,13 +6,13 @@ It supports both path modifications and configuration changes.
 """
 
 from __future__ import annotations
-import copy
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Callable, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Callable, Tuple, TYPE_CHECKING
 from dataclasses import replace
+from models.path_model import clone_element
 
 if TYPE_CHECKING:
-    from models.path_model import Path
+    from models.path_model import Path, PathElement
     from utils.project_manager import ProjectManager
 
 class Command(ABC):
@@ -44,11 +44,23 @@ class PathCommand(Command):
         new_state: 'Path',
         description: str,
         on_change_callback: Optional[Callable[[], None]] = None,
-        suppress_first_callback: bool = False
+        suppress_first_callback: bool = False,
+        patch: Optional[Tuple[int, 'PathElement', 'PathElement']] = None,
+        adopt_old_state: bool = False
     ):
         self.path_ref = path_ref
-        self.old_state = copy.deepcopy(old_state)
-        self.new_state = copy.deepcopy(new_state)
+        # With a patch (index, old element, new element) only that element is stored and swapped;
+        # otherwise the whole path is snapshotted. adopt_old_state=True means the caller hands over
+        # a private snapshot, which is kept as-is (stored states are only ever read via snapshot()).
+        if patch is not None:
+            index, old_element, new_element = patch
+            self._patch_index: Optional[int] = index
+            self.old_state = clone_element(old_element)
+            self.new_state = clone_element(new_element)
+        else:
+            self._patch_index = None
+            self.old_state = old_state if adopt_old_state else old_state.snapshot()
+            self.new_state = new_state.snapshot()
         self.description = description
         self.on_change_callback = on_change_callback
         # Avoid triggering heavy refresh immediately when the user just made the change
@@ -57,13 +69,7 @@ class PathCommand(Command):
     
     def execute(self) -> None:
         """Apply the new state to the path."""
-        self.path_ref.path_elements = copy.deepcopy(self.new_state.path_elements)
-        self.path_ref.constraints = copy.deepcopy(self.new_state.constraints)
-        # Also restore ranged constraints to fully capture constraint UI edits
-        try:
-            self.path_ref.ranged_constraints = copy.deepcopy(getattr(self.new_state, 'ranged_constraints', []))
-        except Exception:
-            pass
+        self._apply(self.new_state)
         # Trigger callback except for the very first execute when suppression requested
         if self.on_change_callback:
             if not self._has_executed_once or not self._suppress_first_callback:
@@ -80,20 +86,48 @@ class PathCommand(Command):
     
     def undo(self) -> None:
         """Revert to the old state."""
-        self.path_ref.path_elements = copy.deepcopy(self.old_state.path_elements)
-        self.path_ref.constraints = copy.deepcopy(self.old_state.constraints)
-        # Also revert ranged constraints
-        try:
-            self.path_ref.ranged_constraints = copy.deepcopy(getattr(self.old_state, 'ranged_constraints', []))
-        except Exception:
-            pass
+        self._apply(self.old_state)
         if self.on_change_callback:
             self.on_change_callback()
     
+    def _apply(self, stored) -> None:
+        if self._patch_index is not None:
+            self.path_ref.path_elements[self._patch_index] = clone_element(stored)
+            return
+        state = stored.snapshot()
+        self.path_ref.path_elements = state.path_elements
+        self.path_ref.constraints = state.constraints
+        # Also restore ranged constraints to fully capture constraint UI edits
+        try:
+            self.path_ref.ranged_constraints = state.ranged_constraints
+        except Exception:
+            pass
+
     def get_description(self) -> str:
         return self.description
 
 
+def single_element_patch(old_state: 'Path', new_state: 'Path') -> Optional[Tuple[int, 'PathElement', 'PathElement']]:
+    """Return (index, old element, new element) if the two paths differ in exactly one element, else None.
+
+    Structural edits (insert/delete/reorder/type change) and constraint edits return None.
+    """
+    old_elements = old_state.path_elements
+    new_elements = new_state.path_elements
+    if len(old_elements) != len(new_elements):
+        return None
+    if old_state.constraints != new_state.constraints or old_state.ranged_constraints != new_state.ranged_constraints:
+        return None
+    patch = None
+    for i, (old_el, new_el) in enumerate(zip(old_elements, new_elements)):
+        if old_el == new_el:
+            continue
+        if patch is not None or type(old_el) is not type(new_el):
+            return None
+        patch = (i, old_el, new_el)
+    return patch
+
+
 class ConfigCommand(Command):
     """Command for configuration modifications."""
     
@@ -106,21 +140,22 @@ class ConfigCommand(Command):
         on_change_callback: Optional[Callable[[], None]] = None
     ):
         self.project_manager = project_manager
-        self.old_config = copy.deepcopy(old_config)
-        self.new_config = copy.deepcopy(new_config)
+        # Config is a flat dict of scalars; shallow copies are independent snapshots
+        self.old_config = dict(old_config)
+        self.new_config = dict(new_config)
         self.description = description
         self.on_change_callback = on_change_callback
     
     def execute(self) -> None:
         """Apply the new configuration."""
-        self.project_manager.config = copy.deepcopy(self.new_config)
+        self.project_manager.config = dict(self.new_config)
         self.project_manager.save_config()
         if self.on_change_callback:
             self.on_change_callback()
     
     def undo(self) -> None:
         """Revert to the old configuration."""
-        self.project_manager.config = copy.deepcopy(self.old_config)
+        self.project_manager.config = dict(self.old_config)
         self.project_manager.save_config()
         if self.on_change_callback:
             self.on_change_callback()
@@ -187,6 +222,13 @@ class UndoRedoManager:
         This clears the redo stack.
         """
         command.execute()
+        self.push_command(command)
+    
+    def push_command(self, command: Command) -> None:
+        """
+        Add an already-applied command to the undo stack without executing it.
+        This clears the redo stack.
+        """
         self.undo_stack.append(command)
         
         # Limit the size of the undo stack